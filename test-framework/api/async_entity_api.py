@@ -0,0 +1,211 @@
+import asyncio
+import json
+import aiohttp
+import allure
+import requests
+from typing import Dict, Any, Tuple, Optional, List, Iterable, Mapping
+from api.entity_api import DEFAULT_POOL_SIZE, DEFAULT_TIMEOUT
+from models.entity_models import validator_for
+from utils.allure_utils import allure_request_logger, allure_response_logger
+
+
+DEFAULT_CONCURRENCY = 10
+
+
+class AsyncResponse:
+    """Fully read aiohttp response exposing the requests.Response attributes used for logging."""
+
+    def __init__(
+        self,
+        url: str,
+        status_code: int,
+        content: bytes,
+        headers: Mapping[str, str],
+    ):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = requests.structures.CaseInsensitiveDict(headers)
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}")
+
+
+class AsyncEntityAPI:
+    """Asyncio counterpart of EntityAPI.
+
+    Allure steps are recorded only after a response is fully read, so concurrent
+    requests never interleave open steps. Use it as an async context manager:
+
+        async with AsyncEntityAPI(base_url) as client:
+            ids = await client.bulk_create(payloads)
+    """
+
+    def __init__(
+        self,
+        base_url="http://localhost:8080",
+        concurrency: int = DEFAULT_CONCURRENCY,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        timeout: Optional[float] = DEFAULT_TIMEOUT,
+    ):
+        self.base_url = base_url
+        self.concurrency = concurrency
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.headers = {
+            "accept": "application/json",
+            "Content-Type": "application/json",
+        }
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> "AsyncEntityAPI":
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.pool_size),
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying aiohttp session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _request(
+        self,
+        step_title: str,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        data: Optional[Dict[str, Any]] = None,
+    ) -> AsyncResponse:
+        """Send a request and log it to Allure once the body has been read."""
+        if self._session is None:
+            raise RuntimeError(
+                "AsyncEntityAPI must be used as an async context manager"
+            )
+
+        async with self._session.request(
+            method, url, headers=headers, json=data
+        ) as response:
+            content = await response.read()
+            result = AsyncResponse(url, response.status, content, response.headers)
+
+        with allure.step(step_title):
+            allure_request_logger(method, url, headers, data)
+            allure_response_logger(result)
+
+        return result
+
+    async def create_entity(self, data: Dict[str, Any]) -> int:
+        """Create a new entity and return its ID."""
+        url = f"{self.base_url}/api/create"
+
+        response = await self._request(
+            "Create a new entity", "POST", url, self.headers, data
+        )
+
+        response.raise_for_status()
+        # Strict, as in EntityAPI.create_entity
+        return validator_for(int).validate_json(response.content, strict=True)
+
+    async def get_entity(self, entity_id: int) -> Tuple[Dict[str, Any], int]:
+        """Get entity by ID and return the data and status code."""
+        url = f"{self.base_url}/api/get/{entity_id}"
+        headers = {"accept": "application/json"}
+
+        response = await self._request(
+            f"Get entity by ID {entity_id}", "GET", url, headers
+        )
+
+        return response.json(), response.status_code
+
+    async def get_all_entities(self) -> Tuple[Dict[str, Any], int]:
+        """Get all entities and return the data and status code."""
+        url = f"{self.base_url}/api/getAll"
+        headers = {"accept": "application/json"}
+
+        response = await self._request("Get all entities", "GET", url, headers)
+
+        return response.json(), response.status_code
+
+    async def update_entity(self, entity_id: int, data: Dict[str, Any]) -> int:
+        """Update an entity and return the status code."""
+        url = f"{self.base_url}/api/patch/{entity_id}"
+
+        response = await self._request(
+            f"Update entity with ID {entity_id}", "PATCH", url, self.headers, data
+        )
+
+        return response.status_code
+
+    async def delete_entity(self, entity_id: int) -> int:
+        """Delete an entity and return the status code."""
+        url = f"{self.base_url}/api/delete/{entity_id}"
+        headers = {"accept": "text/plain"}
+
+        response = await self._request(
+            f"Delete entity with ID {entity_id}", "DELETE", url, headers
+        )
+
+        return response.status_code
+
+    async def bulk_create(self, payloads: Iterable[Dict[str, Any]]) -> List[int]:
+        """Create entities concurrently and return their IDs in payload order.
+
+        If any creation fails, the entities that were created are deleted
+        and the first error is raised.
+        """
+        payloads = list(payloads)
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def create(data: Dict[str, Any]) -> int:
+            async with semaphore:
+                return await self.create_entity(data)
+
+        with allure.step(f"Bulk create {len(payloads)} entities"):
+            results = await asyncio.gather(
+                *(create(data) for data in payloads), return_exceptions=True
+            )
+
+            errors = [result for result in results if isinstance(result, BaseException)]
+            if errors:
+                created = [
+                    result
+                    for result in results
+                    if not isinstance(result, BaseException)
+                ]
+                await self.bulk_delete(created)
+                raise errors[0]
+
+        return results
+
+    async def bulk_delete(self, entity_ids: Iterable[int]) -> Dict[int, int]:
+        """Delete entities concurrently and return status code (or -1 on error) by ID."""
+        entity_ids = list(entity_ids)
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def delete(entity_id: int) -> int:
+            async with semaphore:
+                return await self.delete_entity(entity_id)
+
+        with allure.step(f"Bulk delete {len(entity_ids)} entities"):
+            results = await asyncio.gather(
+                *(delete(entity_id) for entity_id in entity_ids), return_exceptions=True
+            )
+
+        return {
+            entity_id: -1 if isinstance(result, BaseException) else result
+            for entity_id, result in zip(entity_ids, results)
+        }
@@ -0,0 +1,93 @@
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Dict, Any, List
+from api.entity_api import EntityAPI
+
+
+DEFAULT_CLEANUP_WORKERS = 4
+DEFAULT_CLEANUP_RETRIES = 3
+DEFAULT_CLEANUP_BACKOFF = 0.5
+
+
+class CleanupRegistry:
+    """Deletes entities on background threads, off the tests' critical path.
+
+    Deletes run through EntityAPI.purge_entity, which skips Allure logging:
+    Allure steps from worker threads would land in whichever test is running.
+    Failures are collected and reported once by summary().
+    """
+
+    def __init__(
+        self,
+        client: EntityAPI,
+        max_workers: int = DEFAULT_CLEANUP_WORKERS,
+        retries: int = DEFAULT_CLEANUP_RETRIES,
+        backoff: float = DEFAULT_CLEANUP_BACKOFF,
+    ):
+        self.client = client
+        self.retries = retries
+        self.backoff = backoff
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="entity-cleanup"
+        )
+        self._lock = threading.Lock()
+        self._futures: List[Future] = []
+        self._enqueued = 0
+        self._deleted: List[int] = []
+        self._already_deleted: List[int] = []
+        self._failed: Dict[int, str] = {}
+
+    def enqueue(self, entity_id: int) -> None:
+        """Schedule an entity for deletion and return immediately."""
+        with self._lock:
+            self._enqueued += 1
+            self._futures.append(self._executor.submit(self._delete, entity_id))
+
+    def _delete(self, entity_id: int) -> None:
+        """Delete an entity, retrying errors with exponential backoff."""
+        error = ""
+        for attempt in range(self.retries + 1):
+            if attempt:
+                time.sleep(self.backoff * 2 ** (attempt - 1))
+            try:
+                status_code = self.client.purge_entity(entity_id)
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+                continue
+
+            if status_code in (200, 204):
+                with self._lock:
+                    self._deleted.append(entity_id)
+                return
+            if status_code == 404:
+                with self._lock:
+                    self._already_deleted.append(entity_id)
+                return
+            error = f"Unexpected status code {status_code}"
+
+        with self._lock:
+            self._failed[entity_id] = f"{error} after {self.retries + 1} attempts"
+
+    def flush(self) -> Dict[str, Any]:
+        """Wait for every enqueued delete to finish and return the summary."""
+        with self._lock:
+            futures, self._futures = self._futures, []
+        wait(futures)
+        return self.summary()
+
+    def shutdown(self) -> Dict[str, Any]:
+        """Flush pending deletes and stop the worker threads."""
+        summary = self.flush()
+        self._executor.shutdown(wait=True)
+        return summary
+
+    def summary(self) -> Dict[str, Any]:
+        """Return counters of finished deletes and the reasons of failed ones."""
+        with self._lock:
+            return {
+                "enqueued": self._enqueued,
+                "deleted": len(self._deleted),
+                "already_deleted": sorted(self._already_deleted),
+                "failed": {str(k): v for k, v in sorted(self._failed.items())},
+            }
@@ -1,16 +1,108 @@
 import requests
 import allure
-from typing import Dict, Any, Tuple
-from utils.allure_utils import allure_request_logger, allure_response_logger
+from contextlib import closing
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from pydantic import BaseModel
+from typing import Dict, Any, Tuple, Optional, Set, Iterator, Callable, List
+from models.entity_models import (
+    ExportData,
+    EntityResponse,
+    validator_for,
+)
+from utils.allure_utils import (
+    allure_request_logger,
+    allure_response_logger,
+    allure_streamed_response_logger,
+)
+from utils.json_stream import iter_array_items
+from utils.entity_fingerprint import EntityIndex
+
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.3
+DEFAULT_TIMEOUT = 10.0
+DEFAULT_STREAM_CHUNK_SIZE = 64 * 1024
+RETRY_STATUS_CODES = (502, 503, 504)
 
 
 class EntityAPI:
-    def __init__(self, base_url="http://localhost:8080"):
+    def __init__(
+        self,
+        base_url="http://localhost:8080",
+        pool_size: int = DEFAULT_POOL_SIZE,
+        retries: int = DEFAULT_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        timeout: Optional[float] = DEFAULT_TIMEOUT,
+    ):
         self.base_url = base_url
+        self.timeout = timeout
         self.headers = {
             "accept": "application/json",
             "Content-Type": "application/json",
         }
+        self.session = self._build_session(pool_size, retries, backoff_factor)
+        # IDs leased to read-only tests, see api/entity_pool.py
+        self.read_only_ids: Set[int] = set()
+
+    @staticmethod
+    def _build_session(
+        pool_size: int, retries: int, backoff_factor: float
+    ) -> requests.Session:
+        """Build a keep-alive session with a bounded connection pool and retries."""
+        # Only idempotent methods are retried on read errors and 5xx statuses,
+        # connection errors are retried for every method since nothing was sent yet
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUS_CODES,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+        )
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request through the pooled session with the default timeout."""
+        kwargs.setdefault("timeout", self.timeout)
+        return self.session.request(method, url, **kwargs)
+
+    def send(self, method: str, path: str, **kwargs) -> requests.Response:
+        """Send a request to an API path without Allure logging, e.g. for timing."""
+        return self._request(method, f"{self.base_url}{path}", **kwargs)
+
+    def connection_stats(self) -> Dict[str, int]:
+        """Return request and connection counters of the pooled session."""
+        requests_sent = 0
+        connections_opened = 0
+        for adapter in set(self.session.adapters.values()):
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools[key]
+                requests_sent += pool.num_requests
+                connections_opened += pool.num_connections
+
+        return {
+            "requests": requests_sent,
+            "connections_opened": connections_opened,
+            "connections_reused": max(requests_sent - connections_opened, 0),
+        }
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self.session.close()
+
+    def _check_writable(self, entity_id: int) -> None:
+        """Refuse to modify an entity that is leased for read-only use."""
+        if entity_id in self.read_only_ids:
+            raise PermissionError(
+                f"Entity {entity_id} is leased read-only and must not be modified"
+            )
 
     @allure.step("Create a new entity")
     def create_entity(self, data: Dict[str, Any]) -> int:
@@ -19,12 +111,13 @@ class EntityAPI:
 
         allure_request_logger("POST", url, self.headers, data)
 
-        response = requests.post(url, headers=self.headers, json=data)
+        response = self._request("POST", url, headers=self.headers, json=data)
 
         allure_response_logger(response)
 
         response.raise_for_status()
-        return response.json()
+        # Strict, so an ID sent as "42" or 42.0 fails instead of passing as 42
+        return validator_for(int).validate_json(response.content, strict=True)
 
     @allure.step("Get entity by ID {entity_id}")
     def get_entity(self, entity_id: int) -> Tuple[Dict[str, Any], int]:
@@ -34,7 +127,7 @@ class EntityAPI:
 
         allure_request_logger("GET", url, headers)
 
-        response = requests.get(url, headers=headers)
+        response = self._request("GET", url, headers=headers)
 
         allure_response_logger(response)
 
@@ -48,20 +141,123 @@ class EntityAPI:
 
         allure_request_logger("GET", url, headers)
 
-        response = requests.get(url, headers=headers)
+        response = self._request("GET", url, headers=headers)
 
         allure_response_logger(response)
 
         return response.json(), response.status_code
 
+    @allure.step("Get entity model by ID {entity_id}")
+    def get_entity_model(self, entity_id: int) -> Tuple[Optional[ExportData], int]:
+        """Get entity by ID validated straight from the response bytes.
+
+        Returns None instead of the model when the status code is not 200.
+        """
+        url = f"{self.base_url}/api/get/{entity_id}"
+        headers = {"accept": "application/json"}
+
+        allure_request_logger("GET", url, headers)
+
+        response = self._request("GET", url, headers=headers)
+
+        allure_response_logger(response)
+
+        if response.status_code != 200:
+            return None, response.status_code
+        return (
+            validator_for(ExportData).validate_json(response.content),
+            response.status_code,
+        )
+
+    @allure.step("Get all entity models")
+    def get_all_entities_model(self) -> Tuple[EntityResponse, int]:
+        """Get all entities as a typed model."""
+        url = f"{self.base_url}/api/getAll"
+        headers = {"accept": "application/json"}
+
+        allure_request_logger("GET", url, headers)
+
+        response = self._request("GET", url, headers=headers)
+
+        allure_response_logger(response)
+
+        response.raise_for_status()
+        return (
+            validator_for(EntityResponse).validate_json(response.content),
+            response.status_code,
+        )
+
+    def iter_entities(
+        self, chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE
+    ) -> Iterator[ExportData]:
+        """Stream /api/getAll and yield validated entities one by one.
+
+        The response body is parsed while it is read; closing the iterator
+        early closes the connection without downloading the rest.
+        """
+        url = f"{self.base_url}/api/getAll"
+        headers = {"accept": "application/json"}
+
+        allure_request_logger("GET", url, headers)
+
+        with self._request("GET", url, headers=headers, stream=True) as response:
+            allure_streamed_response_logger(response)
+            response.raise_for_status()
+
+            for item in iter_array_items(response.iter_content(chunk_size), "entity"):
+                yield ExportData.model_validate(item)
+
+    @allure.step("Index all entities by content fingerprint")
+    def build_entity_index(
+        self, chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE
+    ) -> Tuple[EntityIndex, int]:
+        """Stream /api/getAll once into a fingerprint index of the listed entities.
+
+        Every entity is validated as ExportData before it is indexed, so a
+        schema change fails here and extra server fields do not change the
+        fingerprints.
+        """
+        url = f"{self.base_url}/api/getAll"
+        headers = {"accept": "application/json"}
+
+        allure_request_logger("GET", url, headers)
+
+        with self._request("GET", url, headers=headers, stream=True) as response:
+            allure_streamed_response_logger(response)
+            response.raise_for_status()
+
+            validator = validator_for(ExportData)
+            items = iter_array_items(response.iter_content(chunk_size), "entity")
+            index = EntityIndex(validator.validate_python(item) for item in items)
+
+        allure.attach(str(len(index)), "Total entities indexed")
+        return index, response.status_code
+
+    @allure.step("Find entity in the streamed list of all entities")
+    def find_entity(
+        self, predicate: Callable[[ExportData], bool]
+    ) -> Optional[ExportData]:
+        """Return the first entity matching the predicate, reading no further."""
+        scanned = 0
+        with closing(self.iter_entities()) as entities:
+            for entity in entities:
+                scanned += 1
+                if predicate(entity):
+                    allure.attach(str(scanned), "Entities scanned")
+                    return entity
+
+        allure.attach(str(scanned), "Entities scanned")
+        return None
+
     @allure.step("Update entity with ID {entity_id}")
     def update_entity(self, entity_id: int, data: Dict[str, Any]) -> int:
         """Update an entity and return the status code."""
+        self._check_writable(entity_id)
         url = f"{self.base_url}/api/patch/{entity_id}"
 
         allure_request_logger("PATCH", url, self.headers, data)
 
-        response = requests.patch(url, headers=self.headers, json=data)
+        response = self._request("PATCH", url, headers=self.headers, json=data)
 
         allure_response_logger(response)
 
@@ -70,17 +266,141 @@ class EntityAPI:
     @allure.step("Delete entity with ID {entity_id}")
     def delete_entity(self, entity_id: int) -> int:
         """Delete an entity and return the status code."""
+        self._check_writable(entity_id)
         url = f"{self.base_url}/api/delete/{entity_id}"
         headers = {"accept": "text/plain"}
 
         allure_request_logger("DELETE", url, headers)
 
-        response = requests.delete(url, headers=headers)
+        response = self._request("DELETE", url, headers=headers)
 
         allure_response_logger(response)
 
         return response.status_code
 
+    def purge_entity(self, entity_id: int) -> int:
+        """Delete an entity without Allure logging and return the status code.
+
+        Meant for background threads, which have no test to attach steps to.
+        """
+        self._check_writable(entity_id)
+
+        response = self.send(
+            "DELETE", f"/api/delete/{entity_id}", headers={"accept": "text/plain"}
+        )
+
+        return response.status_code
+
+    @staticmethod
+    def diff_ignoring_ids(
+        actual, expected, expected_id=None, check_top_level_id=False
+    ) -> Optional[str]:
+        """Describe the first difference of a response from a payload, ignoring IDs.
+
+        Works on dicts and pydantic models in place and stops at the first
+        mismatch. Returns None when both are equal. The top-level ID check
+        behaves as in remove_id_keys.
+        """
+        if (
+            check_top_level_id
+            and expected_id is not None
+            and EntityAPI._has_field(actual, "id")
+        ):
+            actual_id = EntityAPI._field(actual, "id")
+            assert (
+                actual_id == expected_id
+            ), f"Expected ID {expected_id}, but got {actual_id}"
+
+        difference = EntityAPI._first_difference(actual, expected)
+        if difference is None:
+            return None
+
+        # The path is collected in reverse while unwinding the recursion
+        path, reason = difference
+        return "$" + "".join(reversed(path)) + f": {reason}"
+
+    @staticmethod
+    def equals_ignoring_ids(
+        actual, expected, expected_id=None, check_top_level_id=False
+    ) -> bool:
+        """Compare a response with a payload ignoring IDs, without copying either."""
+        return (
+            EntityAPI.diff_ignoring_ids(
+                actual, expected, expected_id, check_top_level_id
+            )
+            is None
+        )
+
+    @staticmethod
+    def assert_equal_ignoring_ids(
+        actual, expected, expected_id=None, check_top_level_id=False
+    ) -> None:
+        """Assert a response matches a payload ignoring IDs, showing the first diff."""
+        difference = EntityAPI.diff_ignoring_ids(
+            actual, expected, expected_id, check_top_level_id
+        )
+        assert difference is None, f"Entity data differs at {difference}"
+
+    @staticmethod
+    def _has_field(obj, name: str) -> bool:
+        # A model field is present in its model_dump() whatever its value
+        if isinstance(obj, BaseModel):
+            return name in type(obj).model_fields
+        return isinstance(obj, dict) and name in obj
+
+    @staticmethod
+    def _field(obj, name: str):
+        if isinstance(obj, BaseModel):
+            return getattr(obj, name, None)
+        return obj.get(name) if isinstance(obj, dict) else None
+
+    @staticmethod
+    def _first_difference(actual, expected) -> Optional[Tuple[List[str], str]]:
+        if isinstance(actual, (dict, BaseModel)):
+            if not isinstance(expected, dict):
+                return [], f"expected {type(expected).__name__}, got object"
+
+            if isinstance(actual, BaseModel):
+                keys = type(actual).model_fields
+                get = actual.__getattribute__
+            else:
+                keys = actual
+                get = actual.__getitem__
+
+            matched = 0
+            for key in keys:
+                if key == "id":
+                    continue
+                if key not in expected:
+                    return [f".{key}"], "unexpected key"
+                difference = EntityAPI._first_difference(get(key), expected[key])
+                if difference is not None:
+                    difference[0].append(f".{key}")
+                    return difference
+                matched += 1
+
+            if matched != sum(1 for key in expected if key != "id"):
+                for key in expected:
+                    if key != "id" and key not in keys:
+                        return [f".{key}"], "missing key"
+            return None
+
+        if isinstance(actual, list):
+            if not isinstance(expected, list):
+                return [], f"expected {type(expected).__name__}, got list"
+            if len(actual) != len(expected):
+                return [], f"expected {len(expected)} items, got {len(actual)}"
+            for index, (actual_item, expected_item) in enumerate(zip(actual, expected)):
+                difference = EntityAPI._first_difference(actual_item, expected_item)
+                if difference is not None:
+                    difference[0].append(f"[{index}]")
+                    return difference
+            return None
+
+        if actual != expected:
+            return [], f"expected {expected!r}, got {actual!r}"
+        return None
+
     @staticmethod
     def remove_id_keys(d, expected_id=None, check_top_level_id=False):
         """Remove ID fields from the response for comparison."""
@@ -0,0 +1,135 @@
+import asyncio
+import itertools
+import threading
+import allure
+from typing import Dict, Any, List, Callable
+from api.entity_api import EntityAPI
+from api.async_entity_api import AsyncEntityAPI, DEFAULT_CONCURRENCY
+from utils.data_generator_for_api import generate_entity_data
+
+
+DEFAULT_ENTITY_POOL_SIZE = 3
+
+
+class EntityLease:
+    """Read-only handle to a pooled entity and the payload it was created from."""
+
+    def __init__(self, entity_id: int, data: Dict[str, Any]):
+        self.entity_id = entity_id
+        self.data = data
+
+    def __repr__(self) -> str:
+        return f"EntityLease(entity_id={self.entity_id})"
+
+
+class EntityPool:
+    """Pre-created entities shared by read-only tests of one xdist worker.
+
+    Leased entities are registered as read-only on the API client, so an
+    update or delete of a leased entity fails instead of silently changing
+    data another test relies on. Mutating tests must create their own entity.
+    """
+
+    def __init__(
+        self,
+        client: EntityAPI,
+        size: int = DEFAULT_ENTITY_POOL_SIZE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        payload_factory: Callable[[], Dict[str, Any]] = generate_entity_data,
+    ):
+        self.client = client
+        self.size = size
+        self.concurrency = concurrency
+        self.payload_factory = payload_factory
+        self._lock = threading.Lock()
+        self._entities: Dict[int, Dict[str, Any]] = {}
+        self._leases: Dict[int, int] = {}
+        self._rotation = itertools.cycle([])
+        self._leases_served = 0
+        self._entities_created = 0
+
+    def _async_client(self) -> AsyncEntityAPI:
+        return AsyncEntityAPI(
+            self.client.base_url,
+            concurrency=self.concurrency,
+            pool_size=self.concurrency,
+            timeout=self.client.timeout,
+        )
+
+    async def _bulk_create(self, payloads: List[Dict[str, Any]]) -> List[int]:
+        async with self._async_client() as client:
+            return await client.bulk_create(payloads)
+
+    async def _bulk_delete(self, entity_ids: List[int]) -> Dict[int, int]:
+        async with self._async_client() as client:
+            return await client.bulk_delete(entity_ids)
+
+    @allure.step("Fill entity pool")
+    def fill(self) -> None:
+        """Create the pool entities concurrently."""
+        payloads = [self.payload_factory() for _ in range(self.size)]
+        entity_ids = asyncio.run(self._bulk_create(payloads)) if payloads else []
+
+        with self._lock:
+            for entity_id, data in zip(entity_ids, payloads):
+                self._entities[entity_id] = data
+                self._leases[entity_id] = 0
+            self._entities_created += len(entity_ids)
+            self._rotation = itertools.cycle(list(self._entities))
+
+    def lease(self) -> EntityLease:
+        """Lease an entity for read-only use, creating one if the pool is empty."""
+        with self._lock:
+            if not self._entities:
+                data = self.payload_factory()
+                entity_id = self.client.create_entity(data)
+                self._entities[entity_id] = data
+                self._leases[entity_id] = 0
+                self._entities_created += 1
+                self._rotation = itertools.cycle(list(self._entities))
+
+            entity_id = next(self._rotation)
+            self._leases[entity_id] += 1
+            self._leases_served += 1
+            self.client.read_only_ids.add(entity_id)
+            return EntityLease(entity_id, self._entities[entity_id])
+
+    def release(self, lease: EntityLease) -> None:
+        """Return a lease to the pool."""
+        with self._lock:
+            self._leases[lease.entity_id] -= 1
+            if self._leases[lease.entity_id] == 0:
+                self.client.read_only_ids.discard(lease.entity_id)
+
+    def entities(self) -> Dict[int, Dict[str, Any]]:
+        """Return a snapshot of pooled entity payloads by ID."""
+        with self._lock:
+            return dict(self._entities)
+
+    @allure.step("Drain entity pool")
+    def drain(self) -> Dict[int, int]:
+        """Delete every pooled entity and return delete status codes by ID."""
+        with self._lock:
+            entity_ids = list(self._entities)
+            active = [entity_id for entity_id, count in self._leases.items() if count]
+            if active:
+                raise RuntimeError(f"Entities are still leased: {active}")
+            self._entities.clear()
+            self._leases.clear()
+            self._rotation = itertools.cycle([])
+
+        return asyncio.run(self._bulk_delete(entity_ids)) if entity_ids else {}
+
+    def stats(self) -> Dict[str, int]:
+        """Return lease counters and the API round trips saved by the pool."""
+        with self._lock:
+            # Without the pool every lease would be a create and a delete on
+            # the test's critical path; the pool pays the same per entity once
+            return {
+                "pool_size": self.size,
+                "entities_created": self._entities_created,
+                "leases_served": self._leases_served,
+                "critical_path_round_trips_saved": 2 * self._leases_served,
+                "net_round_trips_saved": 2
+                * (self._leases_served - self._entities_created),
+            }
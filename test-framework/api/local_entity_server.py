@@ -0,0 +1,186 @@
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+
+from pydantic import ValidationError
+
+from models.entity_models import EntityData, ExportData
+
+
+API_VERSION = "local-stand-in"
+ENTITY_PATH = re.compile(r"^/api/(get|patch|delete)/(\d+)$")
+
+
+class EntityStore:
+    """Thread-safe in-memory entity storage with sequential IDs."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entities: Dict[int, Dict[str, Any]] = {}
+        self._next_id = 1
+        self._next_addition_id = 1
+
+    def _export(self, entity_id: int, data: EntityData) -> Dict[str, Any]:
+        addition = data.addition.model_dump()
+        addition["id"] = self._next_addition_id
+        self._next_addition_id += 1
+        export = data.model_dump()
+        export["id"] = entity_id
+        export["addition"] = addition
+        return ExportData.model_validate(export).model_dump()
+
+    def create(self, data: EntityData) -> int:
+        with self._lock:
+            entity_id = self._next_id
+            self._next_id += 1
+            self._entities[entity_id] = self._export(entity_id, data)
+            return entity_id
+
+    def get(self, entity_id: int) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._entities.get(entity_id)
+
+    def get_all(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"entity": list(self._entities.values())}
+
+    def update(self, entity_id: int, data: EntityData) -> bool:
+        with self._lock:
+            if entity_id not in self._entities:
+                return False
+            self._entities[entity_id] = self._export(entity_id, data)
+            return True
+
+    def delete(self, entity_id: int) -> bool:
+        with self._lock:
+            return self._entities.pop(entity_id, None) is not None
+
+
+class EntityRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; with Nagle's algorithm the
+    # client's delayed ACK adds ~40ms to every keep-alive response
+    disable_nagle_algorithm = True
+    server: "LocalEntityServer"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # Keep the pytest output clean
+        pass
+
+    def _read_body(self) -> bytes:
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length > 0 else b""
+
+    @staticmethod
+    def _parse_entity_data(body: bytes) -> Optional[EntityData]:
+        try:
+            return EntityData.model_validate_json(body)
+        except ValidationError:
+            return None
+
+    def _send(
+        self, status: int, body: Any = None, content_type: str = "application/json"
+    ) -> None:
+        if body is None:
+            payload = b""
+        elif isinstance(body, str) and content_type != "application/json":
+            payload = body.encode("utf-8")
+        else:
+            payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+
+        self.send_response(status)
+        if payload:
+            self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _route(self, method: str) -> Tuple[str, Optional[int]]:
+        match = ENTITY_PATH.match(self.path)
+        if match:
+            return f"{method} /api/{match.group(1)}", int(match.group(2))
+        return f"{method} {self.path}", None
+
+    def _dispatch(self, method: str) -> None:
+        self.server.inject_latency()
+        # Read on every route, an unread body would corrupt the keep-alive stream
+        body = self._read_body()
+        route, entity_id = self._route(method)
+        store = self.server.store
+
+        if route == "POST /api/create":
+            data = self._parse_entity_data(body)
+            if data is None:
+                return self._send(400, {"error": "invalid entity"})
+            return self._send(200, store.create(data))
+        if route == "GET /api/getAll":
+            return self._send(200, store.get_all())
+        if route == "GET /api/version":
+            return self._send(200, API_VERSION, "text/plain")
+        if route == "GET /api/get":
+            entity = store.get(entity_id)
+            if entity is None:
+                return self._send(404, {"error": "entity not found"})
+            return self._send(200, entity)
+        if route == "PATCH /api/patch":
+            data = self._parse_entity_data(body)
+            if data is None:
+                return self._send(400, {"error": "invalid entity"})
+            if not store.update(entity_id, data):
+                return self._send(404, {"error": "entity not found"})
+            return self._send(204)
+        if route == "DELETE /api/delete":
+            if not store.delete(entity_id):
+                return self._send(404, {"error": "entity not found"})
+            return self._send(204)
+        return self._send(404, {"error": f"unknown route {route}"})
+
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+
+    def do_PATCH(self) -> None:
+        self._dispatch("PATCH")
+
+    def do_DELETE(self) -> None:
+        self._dispatch("DELETE")
+
+
+class LocalEntityServer(ThreadingHTTPServer):
+    """In-process stand-in for the Entity API service.
+
+    Serves /api/create, /api/get/{id}, /api/getAll, /api/patch/{id},
+    /api/delete/{id} and /api/version from memory, one thread per connection.
+    Every request is delayed by `latency` seconds to emulate the network.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0):
+        super().__init__((host, port), EntityRequestHandler)
+        self.store = EntityStore()
+        self.latency = latency
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def inject_latency(self) -> None:
+        if self.latency > 0:
+            time.sleep(self.latency)
+
+    def start(self) -> "LocalEntityServer":
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
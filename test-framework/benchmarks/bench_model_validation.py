@@ -0,0 +1,78 @@
+"""Per-response cost of turning Entity API bodies into models.
+
+Compares the old three-pass path (response.json() -> model_validate ->
+model_dump) with single-pass validation from bytes.
+
+Run from the test-framework directory:
+    python -m benchmarks.bench_model_validation --entities 1000
+"""
+import argparse
+import json
+import timeit
+from typing import Callable, Dict
+
+from models.entity_models import (
+    ExportData,
+    EntityResponse,
+    validator_for,
+)
+from utils.data_generator_for_api import generate_entity_data
+
+
+def _export(entity_id: int) -> Dict:
+    data = dict(generate_entity_data())
+    data["id"] = entity_id
+    data["addition"] = dict(data["addition"], id=entity_id)
+    return data
+
+
+def _measure(func: Callable[[], object], repeat: int) -> float:
+    """Return the best per-call time in microseconds."""
+    number = max(1, repeat)
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entities", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    entity_body = json.dumps(_export(1), ensure_ascii=False).encode("utf-8")
+    listing_body = json.dumps(
+        {"entity": [_export(i) for i in range(args.entities)]}, ensure_ascii=False
+    ).encode("utf-8")
+    listing_repeat = max(1, args.repeat * 10 // max(args.entities, 1))
+
+    cases = [
+        (
+            "get: json + model_validate + model_dump",
+            lambda: ExportData.model_validate(json.loads(entity_body)).model_dump(),
+            args.repeat,
+        ),
+        (
+            "get: validate_json",
+            lambda: validator_for(ExportData).validate_json(entity_body),
+            args.repeat,
+        ),
+        (
+            f"getAll x{args.entities}: json + model_validate + model_dump",
+            lambda: EntityResponse.model_validate(
+                json.loads(listing_body)
+            ).model_dump(),
+            listing_repeat,
+        ),
+        (
+            f"getAll x{args.entities}: validate_json",
+            lambda: validator_for(EntityResponse).validate_json(listing_body),
+            listing_repeat,
+        ),
+    ]
+
+    width = max(len(name) for name, _, _ in cases)
+    for name, func, repeat in cases:
+        print(f"{name:<{width}}  {_measure(func, repeat):>12.1f} us/response")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,76 @@
 import os
+import json
+import platform
+import random
+import uuid
+from datetime import datetime, timezone
 import pytest
 import allure
+import allure_commons
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.chrome.service import Service as ChromeService
-from webdriver_manager.chrome import ChromeDriverManager
-from api.entity_api import EntityAPI
-from utils.data_generator_for_api import generate_entity_data
-
-from typing import Generator
+from selenium.webdriver.firefox.service import Service as FirefoxService
+from api.entity_api import (
+    EntityAPI,
+    DEFAULT_POOL_SIZE,
+    DEFAULT_RETRIES,
+    DEFAULT_BACKOFF_FACTOR,
+    DEFAULT_TIMEOUT,
+)
+from api.entity_pool import EntityPool, EntityLease, DEFAULT_ENTITY_POOL_SIZE
+from api.cleanup_registry import (
+    CleanupRegistry,
+    DEFAULT_CLEANUP_WORKERS,
+    DEFAULT_CLEANUP_RETRIES,
+)
+from api.local_entity_server import LocalEntityServer
+from utils.data_generator import UniqueCustomerGenerator
+from constants import DEFAULT_LAST_NAME
+from utils.data_generator_for_api import (
+    PayloadPool,
+    PAYLOAD_PROFILES,
+    DEFAULT_PAYLOAD_POOL_SIZE,
+)
+from utils.allure_utils import (
+    HTTP_LOG_MODES,
+    set_http_log_mode,
+    get_http_log_mode,
+    flush_http_log,
+    clear_http_log,
+)
+from utils.driver_pool import DriverPool, DEFAULT_DRIVER_RECYCLE_AFTER
+from utils.driver_binaries import resolve_driver_binary, DEFAULT_DRIVER_CACHE_DIR
+from utils.adaptive_wait import wait_time_report, has_wait_times, clear_wait_times
+from pages.base_page import element_cache_stats, reset_element_cache_stats
+from utils.attachment_writer import (
+    BackgroundAllureFileLogger,
+    install_background_file_logger,
+    uninstall_background_file_logger,
+)
+from utils.screenshots import (
+    screenshots,
+    StepFailureScreenshots,
+    SCREENSHOT_POLICIES,
+    SCREENSHOT_FORMATS,
+)
+from utils.duration_scheduler import DurationSchedulingPlugin
+from utils.resource_blocking import resource_blocking, DEFAULT_BLOCKLIST
+from utils.step_profiler import (
+    StepProfiler,
+    PROFILE_FORMATS,
+    self_time_table,
+    write_profile,
+)
+
+from typing import Generator, Dict, Any, List, Tuple
+
+
+cleanup_registry_key = pytest.StashKey[CleanupRegistry]()
+attachment_logger_key = pytest.StashKey[BackgroundAllureFileLogger]()
+step_profiler_key = pytest.StashKey[StepProfiler]()
+RESOURCE_SIZES_CACHE_KEY = "resource_blocking/sizes"
 
 
 def pytest_addoption(parser) -> None:
@@ -19,92 +80,567 @@ def pytest_addoption(parser) -> None:
     parser.addoption(
         "--mode", default="local", help="Mode to run tests (remote or local)"
     )
+    parser.addoption(
+        "--driver-cache-dir",
+        default=DEFAULT_DRIVER_CACHE_DIR,
+        help="Directory of downloaded driver binaries shared by all workers",
+    )
+    parser.addoption(
+        "--driver-offline",
+        action="store_true",
+        default=False,
+        help="Use only cached driver binaries, never query or download new ones",
+    )
+    parser.addoption(
+        "--driver-recycle-after",
+        type=int,
+        default=DEFAULT_DRIVER_RECYCLE_AFTER,
+        help="Tests served by one pooled browser session before it is restarted",
+    )
+    parser.addoption(
+        "--resource-blocking",
+        default="on",
+        choices=("on", "off"),
+        help="Block requests to --resource-blocklist hosts in UI tests; with off, "
+        "sizes of their resources are learned for the bytes saved estimates",
+    )
+    parser.addoption(
+        "--resource-blocklist",
+        default=",".join(DEFAULT_BLOCKLIST),
+        help="Comma-separated domains (with subdomains) blocked in UI tests, "
+        "* for all; default: ads, analytics and web fonts",
+    )
+    parser.addoption(
+        "--resource-allowlist",
+        default="",
+        help="Comma-separated domains never blocked, overriding the blocklist",
+    )
+    parser.addoption(
+        "--allure-attachments",
+        default="background",
+        choices=("background", "sync"),
+        help="Write Allure attachment files on a background thread in batches, "
+        "or synchronously on the test thread",
+    )
+    parser.addoption(
+        "--allure-gzip-min-size",
+        type=int,
+        default=0,
+        help="Gzip text/JSON attachments of at least this many characters "
+        "(background mode only, 0 disables)",
+    )
+    parser.addoption(
+        "--screenshots",
+        default="always",
+        choices=SCREENSHOT_POLICIES,
+        help="When to take screenshots: always (page object steps and failures), "
+        "on-step-failure or on-failure",
+    )
+    parser.addoption(
+        "--screenshot-scale",
+        type=float,
+        default=1.0,
+        help="Downscale factor for stored screenshots, e.g. 0.5 (requires Pillow)",
+    )
+    parser.addoption(
+        "--screenshot-format",
+        default="png",
+        choices=SCREENSHOT_FORMATS,
+        help="Format of stored screenshots; jpeg is lossy and requires Pillow",
+    )
+    parser.addoption(
+        "--screenshot-quality",
+        type=int,
+        default=75,
+        help="JPEG quality of stored screenshots, 1-95",
+    )
     parser.addoption(
         "--app-url",
         default="http://localhost:8080",
         help="Base URL for the application API",
     )
+    parser.addoption(
+        "--local-api",
+        action="store_true",
+        default=False,
+        help="Run API tests against an in-process stand-in server instead of "
+        "--app-url",
+    )
+    parser.addoption(
+        "--local-api-latency",
+        type=float,
+        default=0.0,
+        help="Latency injected into every stand-in server response, in ms",
+    )
+    parser.addoption(
+        "--api-pool-size",
+        type=int,
+        default=DEFAULT_POOL_SIZE,
+        help="Max keep-alive connections per host in the API client pool",
+    )
+    parser.addoption(
+        "--api-retries",
+        type=int,
+        default=DEFAULT_RETRIES,
+        help="Retries for failed API connections and 502/503/504 responses",
+    )
+    parser.addoption(
+        "--api-backoff",
+        type=float,
+        default=DEFAULT_BACKOFF_FACTOR,
+        help="Exponential backoff factor between API retries, in seconds",
+    )
+    parser.addoption(
+        "--api-timeout",
+        type=float,
+        default=DEFAULT_TIMEOUT,
+        help="Per-request API timeout in seconds",
+    )
+    parser.addoption(
+        "--run-id",
+        default=os.environ.get("TEST_RUN_ID"),
+        help="ID of this run for unique UI customer names; give concurrent runs "
+        "distinct numbers below 64 to rule out collisions (env TEST_RUN_ID)",
+    )
+    parser.addoption(
+        "--data-seed",
+        default=None,
+        help="Seed of generated API payloads; a random one is chosen and printed "
+        "in the report header if not set",
+    )
+    parser.addoption(
+        "--data-profile",
+        default="default",
+        choices=tuple(PAYLOAD_PROFILES),
+        help="Size profile of generated API payloads: default, large or unicode",
+    )
+    parser.addoption(
+        "--data-pool-size",
+        type=int,
+        default=DEFAULT_PAYLOAD_POOL_SIZE,
+        help="API payloads pre-generated per batch for the json_data fixtures",
+    )
+    parser.addoption(
+        "--seed-customers",
+        type=int,
+        default=1,
+        help="Customers seeded into the app state for the sort and delete UI tests",
+    )
+    parser.addoption(
+        "--entity-pool-size",
+        type=int,
+        default=DEFAULT_ENTITY_POOL_SIZE,
+        help="Entities pre-created per worker for read-only API tests",
+    )
+    parser.addoption(
+        "--cleanup-workers",
+        type=int,
+        default=DEFAULT_CLEANUP_WORKERS,
+        help="Background threads deleting entities created by tests",
+    )
+    parser.addoption(
+        "--cleanup-retries",
+        type=int,
+        default=DEFAULT_CLEANUP_RETRIES,
+        help="Retries for failed background entity deletes",
+    )
+    parser.addoption(
+        "--allure-http-log",
+        default="full",
+        choices=HTTP_LOG_MODES,
+        help="HTTP logging to Allure: off, on-failure (buffered, attached only "
+        "when the test fails) or full",
+    )
+    parser.addoption(
+        "--perf-iterations",
+        type=int,
+        default=200,
+        help="Timed requests per endpoint in the perf benchmarks",
+    )
+    parser.addoption(
+        "--perf-warmup",
+        type=int,
+        default=20,
+        help="Untimed warmup requests per endpoint in the perf benchmarks",
+    )
+    parser.addoption(
+        "--perf-output",
+        default="perf-results/entity_api_latency.json",
+        help="JSON file for the perf benchmark results",
+    )
+    parser.addoption(
+        "--perf-baseline",
+        default=None,
+        help="Perf results JSON of a previous run to check for regressions",
+    )
+    parser.addoption(
+        "--perf-max-regression",
+        type=float,
+        default=0.2,
+        help="Allowed p95 latency growth over the baseline, e.g. 0.2 for +20%%",
+    )
+    parser.addoption(
+        "--duration-scheduling",
+        default="on",
+        choices=("on", "off"),
+        help="With -n, send the longest tests of previous runs to xdist workers "
+        "first; durations are stored in the pytest cache",
+    )
+    parser.addoption(
+        "--step-profile",
+        default=None,
+        help="Time every test phase, fixture setup/teardown and Allure step and "
+        "write the call trees to this file, e.g. profile-results/steps.json",
+    )
+    parser.addoption(
+        "--step-profile-format",
+        default="chrome",
+        choices=PROFILE_FORMATS,
+        help="Format of the --step-profile file: chrome (trace event JSON, for "
+        "Perfetto or chrome://tracing) or speedscope",
+    )
 
 
-@pytest.fixture
+# After allure-pytest, so that its reporter is already registered
+@pytest.hookimpl(trylast=True)
+def pytest_configure(config) -> None:
+    set_http_log_mode(config.getoption("--allure-http-log"))
+    # xdist workers use the seed and run ID chosen by the controller
+    workerinput = getattr(config, "workerinput", None)
+    if config.option.data_seed is None:
+        config.option.data_seed = (
+            workerinput["data_seed"] if workerinput else str(random.randrange(2**32))
+        )
+    if config.option.run_id is None:
+        config.option.run_id = (
+            workerinput["run_id"] if workerinput else uuid.uuid4().hex
+        )
+    if workerinput is None:
+        config.pluginmanager.register(
+            DurationSchedulingPlugin(
+                config, config.getoption("--duration-scheduling") == "on"
+            ),
+            "duration_scheduling",
+        )
+
+    listener = config.pluginmanager.get_plugin("allure_listener")
+    reporter = listener.allure_logger if listener else None
+    attachment_logger = None
+    if config.getoption("--allure-attachments") == "background":
+        attachment_logger = install_background_file_logger(
+            reporter, config.getoption("--allure-gzip-min-size")
+        )
+    if attachment_logger is not None:
+        config.stash[attachment_logger_key] = attachment_logger
+        config.add_cleanup(lambda: uninstall_background_file_logger(attachment_logger))
+
+    screenshots.configure(
+        policy=config.getoption("--screenshots"),
+        scale=config.getoption("--screenshot-scale"),
+        image_format=config.getoption("--screenshot-format"),
+        quality=config.getoption("--screenshot-quality"),
+        reporter=reporter,
+        writer=attachment_logger.writer if attachment_logger else None,
+    )
+    resource_blocking.configure(
+        enabled=config.getoption("--resource-blocking") == "on",
+        blocklist=config.getoption("--resource-blocklist").split(","),
+        allowlist=config.getoption("--resource-allowlist").split(","),
+        sizes=(
+            config.cache.get(RESOURCE_SIZES_CACHE_KEY, {})
+            if hasattr(config, "cache")
+            else {}
+        ),
+    )
+
+    step_failure_plugin = StepFailureScreenshots(screenshots)
+    allure_commons.plugin_manager.register(step_failure_plugin)
+    config.add_cleanup(
+        lambda: allure_commons.plugin_manager.unregister(step_failure_plugin)
+    )
+
+    if config.getoption("--step-profile"):
+        profiler = StepProfiler(workerinput["workerid"] if workerinput else "main")
+        config.stash[step_profiler_key] = profiler
+        config.pluginmanager.register(profiler, "step_profiler")
+        allure_commons.plugin_manager.register(profiler)
+        config.add_cleanup(lambda: allure_commons.plugin_manager.unregister(profiler))
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node) -> None:
+    node.workerinput["data_seed"] = node.config.option.data_seed
+    node.workerinput["run_id"] = node.config.option.run_id
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error) -> None:
+    # A crashed worker is reported without any output
+    output = getattr(node, "workeroutput", None) or {}
+    if error:
+        return
+    # Spans recorded by the worker, merged into the controller's profile
+    profiler = node.config.stash.get(step_profiler_key, None)
+    if profiler is not None:
+        profiler.spans.extend(output.get("step_profile", []))
+    # Resource sizes learned by the worker, written to the cache by the controller
+    resource_blocking.merge_learned(output.get("resource_sizes", {}))
+
+
+def pytest_report_header(config) -> str:
+    return (
+        f"API payloads: seed {config.option.data_seed}, "
+        f"profile {config.getoption('--data-profile')}"
+    )
+
+
+def pytest_collection_modifyitems(config, items) -> None:
+    # Benchmarks are long and load the service, run them only with -m perf
+    if "perf" in (config.getoption("-m") or ""):
+        return
+    skip_perf = pytest.mark.skip(reason="perf benchmarks run only with -m perf")
+    for item in items:
+        if "perf" in item.keywords:
+            item.add_marker(skip_perf)
+
+
+@pytest.fixture(scope="session")
+def local_entity_server(request) -> Generator[LocalEntityServer, None, None]:
+    # Session scope under xdist is per worker, so every worker gets its own server
+    server = LocalEntityServer(
+        latency=request.config.getoption("--local-api-latency") / 1000
+    ).start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture(scope="session")
 def app_url(request):
+    if request.config.getoption("--local-api"):
+        return request.getfixturevalue("local_entity_server").url
     return request.config.getoption("--app-url")
 
 
+@pytest.fixture(scope="session")
+def api_session_client(request, app_url) -> Generator[EntityAPI, None, None]:
+    # Session scope is per xdist worker, so every worker keeps its own pool
+    client = EntityAPI(
+        base_url=app_url,
+        pool_size=request.config.getoption("--api-pool-size"),
+        retries=request.config.getoption("--api-retries"),
+        backoff_factor=request.config.getoption("--api-backoff"),
+        timeout=request.config.getoption("--api-timeout"),
+    )
+    yield client
+    client.close()
+
+
 @pytest.fixture
-def api_client(app_url):
+def api_client(api_session_client, app_url):
     with allure.step("Initialize API client"):
-        client = EntityAPI(base_url=app_url)
         allure.attach(app_url, "Base URL")
-        return client
+
+    yield api_session_client
+
+    allure.attach(
+        json.dumps(api_session_client.connection_stats(), indent=2),
+        "Connection Pool Stats",
+        allure.attachment_type.JSON,
+    )
+
+
+@pytest.fixture(scope="session")
+def cleanup_registry(
+    request, api_session_client
+) -> Generator[CleanupRegistry, None, None]:
+    registry = CleanupRegistry(
+        api_session_client,
+        max_workers=request.config.getoption("--cleanup-workers"),
+        retries=request.config.getoption("--cleanup-retries"),
+    )
+    request.config.stash[cleanup_registry_key] = registry
+
+    yield registry
+
+    with allure.step("Teardown: Wait for deferred entity cleanup"):
+        summary = registry.flush()
+        allure.attach(
+            json.dumps(summary, indent=2),
+            "Entity Cleanup Summary",
+            allure.attachment_type.JSON,
+        )
+
+
+@pytest.fixture(scope="session")
+def entity_pool(request, api_session_client) -> Generator[EntityPool, None, None]:
+    pool = EntityPool(
+        api_session_client, size=request.config.getoption("--entity-pool-size")
+    )
+    pool.fill()
+
+    yield pool
+
+    pool.drain()
+    allure.attach(
+        json.dumps(pool.stats(), indent=2),
+        "Entity Pool Stats",
+        allure.attachment_type.JSON,
+    )
 
 
 @pytest.fixture
-def json_data():
+def pooled_entity(entity_pool) -> Generator[EntityLease, None, None]:
+    with allure.step("Setup: Lease entity from the pool"):
+        lease = entity_pool.lease()
+        allure.attach(str(lease.entity_id), "Leased Entity ID")
+
+    yield lease
+
+    entity_pool.release(lease)
+
+
+@pytest.fixture(scope="session")
+def perf_baseline(request) -> Dict[str, Any]:
+    path = request.config.getoption("--perf-baseline")
+    if not path:
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["endpoints"]
+
+
+@pytest.fixture(scope="session")
+def perf_report(request, app_url) -> Generator[Dict[str, Any], None, None]:
+    endpoints: Dict[str, Any] = {}
+
+    yield endpoints
+
+    if not endpoints:
+        return
+
+    path = request.config.getoption("--perf-output")
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER")
+    if worker_id:
+        root, ext = os.path.splitext(path)
+        path = f"{root}.{worker_id}{ext}"
+
+    report = {
+        "schema_version": 1,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "base_url": app_url,
+        "iterations": request.config.getoption("--perf-iterations"),
+        "warmup": request.config.getoption("--perf-warmup"),
+        "python_version": platform.python_version(),
+        "endpoints": endpoints,
+    }
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+
+@pytest.fixture(scope="session")
+def payload_pool(request) -> PayloadPool:
+    return PayloadPool(
+        seed=request.config.option.data_seed,
+        profile=request.config.getoption("--data-profile"),
+        batch_size=request.config.getoption("--data-pool-size"),
+    )
+
+
+@pytest.fixture
+def json_data(payload_pool):
     with allure.step("Generate test data"):
-        data = generate_entity_data()
+        data = payload_pool.next()
         allure.attach(str(data), "Generated Test Data")
         return data
 
 
 @pytest.fixture
-def json_data_for_patch():
+def json_data_for_patch(payload_pool):
     with allure.step("Generate test data for update"):
-        data = generate_entity_data()
+        data = payload_pool.next()
         allure.attach(str(data), "Generated Test Data for Update")
         return data
 
 
 @pytest.fixture
-def created_entity_id(api_client, json_data):
+def created_entity_id(api_client, json_data, cleanup_registry):
     with allure.step("Setup: Create entity for testing"):
         entity_id = api_client.create_entity(json_data)
         allure.attach(str(entity_id), "Created Entity ID")
 
     yield entity_id
 
-    with allure.step(f"Teardown: Delete entity with ID {entity_id}"):
-        try:
-            api_client.delete_entity(entity_id)
-        except Exception as e:
-            allure.attach(
-                str(e), "Exception during entity cleanup", allure.attachment_type.TEXT
-            )
-
-            pass
+    with allure.step(f"Teardown: Schedule deletion of entity with ID {entity_id}"):
+        cleanup_registry.enqueue(entity_id)
 
 
 # UI фикстуры
-@pytest.fixture(scope="function")
-def driver(request) -> Generator[webdriver.Remote, None, None]:
-    browser = request.config.getoption("--browser")
-    mode = request.config.getoption("--mode")
+@pytest.fixture(scope="session")
+def customer_generator(request) -> UniqueCustomerGenerator:
+    return UniqueCustomerGenerator(request.config.option.run_id)
+
+
+@pytest.fixture
+def customers_to_seed(request, customer_generator) -> List[Tuple[str, str, str]]:
+    """Unique (first name, last name, post code) customers to seed into the app"""
+    with allure.step("Generate customers to seed"):
+        return [
+            (first_name, DEFAULT_LAST_NAME, post_code)
+            for first_name, post_code in customer_generator.generate_batch(
+                request.config.getoption("--seed-customers")
+            )
+        ]
+
 
+def _start_driver(config, browser: str) -> Tuple[webdriver.Remote, str, str]:
+    """Start a browser session, return (driver, actual browser, configuration)."""
+    mode = config.getoption("--mode")
     is_remote = mode.lower() == "remote"
 
     if not is_remote:
-        chrome_options = ChromeOptions()
-        chrome_options.add_argument("--headless=new")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_argument("--ignore-certificate-errors")
-        chrome_options.add_argument("--allow-insecure-localhost")
-        chrome_options.page_load_strategy = "eager"
+        # Resolved once per worker from the shared on-disk cache
+        driver_path = resolve_driver_binary(
+            browser,
+            cache_dir=config.getoption("--driver-cache-dir"),
+            offline=config.getoption("--driver-offline"),
+        )
 
-        service = ChromeService(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=chrome_options)
+        if browser == "chrome":
+            chrome_options = ChromeOptions()
+            chrome_options.add_argument("--headless=new")
+            chrome_options.add_argument("--no-sandbox")
+            chrome_options.add_argument("--disable-dev-shm-usage")
+            chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+            chrome_options.add_argument("--ignore-certificate-errors")
+            chrome_options.add_argument("--allow-insecure-localhost")
+            chrome_options.page_load_strategy = "eager"
+            resource_blocking.apply_to_chrome(chrome_options)
 
-        original_browser = browser
-        browser = "chrome"
+            service = ChromeService(driver_path)
+            driver = webdriver.Chrome(service=service, options=chrome_options)
 
-        allure.attach(
-            f"Browser: Chrome (requested: {original_browser})\n"
-            f"Mode: Local\n"
-            f"Options: {chrome_options.arguments}",
-            name="Browser Configuration",
-            attachment_type=allure.attachment_type.TEXT,
-        )
+            description = (
+                f"Browser: Chrome\nMode: Local\nDriver: {driver_path}\n"
+                f"Options: {chrome_options.arguments}"
+            )
+
+        else:
+            firefox_options = FirefoxOptions()
+            firefox_options.add_argument("--headless")
+            firefox_options.set_preference("browser.download.folderList", 2)
+            firefox_options.set_preference(
+                "browser.download.manager.showWhenStarting", False
+            )
+            firefox_options.page_load_strategy = "eager"
+            resource_blocking.apply_to_firefox(firefox_options)
+
+            service = FirefoxService(driver_path)
+            driver = webdriver.Firefox(service=service, options=firefox_options)
+
+            description = (
+                f"Browser: Firefox\nMode: Local\nDriver: {driver_path}\n"
+                f"Options: {firefox_options.arguments}"
+            )
 
     else:
         if browser == "chrome":
@@ -117,6 +653,7 @@ def driver(request) -> Generator[webdriver.Remote, None, None]:
             chrome_options.add_argument("--ignore-certificate-errors")
             chrome_options.add_argument("--allow-insecure-localhost")
             chrome_options.page_load_strategy = "eager"
+            resource_blocking.apply_to_chrome(chrome_options)
 
             selenium_hub_host = os.environ.get("SELENIUM_HUB_HOST", "selenium-hub")
             selenium_hub_port = os.environ.get("SELENIUM_HUB_PORT", "4444")
@@ -126,10 +663,8 @@ def driver(request) -> Generator[webdriver.Remote, None, None]:
                 command_executor=selenium_grid_url, options=chrome_options
             )
 
-            allure.attach(
-                f"Browser: Chrome\nMode: Remote\nOptions: {chrome_options.arguments}",
-                name="Browser Configuration",
-                attachment_type=allure.attachment_type.TEXT,
+            description = (
+                f"Browser: Chrome\nMode: Remote\nOptions: {chrome_options.arguments}"
             )
 
         elif browser == "firefox":
@@ -143,6 +678,7 @@ def driver(request) -> Generator[webdriver.Remote, None, None]:
                 "browser.download.manager.showWhenStarting", False
             )
             firefox_options.page_load_strategy = "eager"
+            resource_blocking.apply_to_firefox(firefox_options)
 
             selenium_hub_host = os.environ.get("SELENIUM_HUB_HOST", "selenium-hub")
             selenium_hub_port = os.environ.get("SELENIUM_HUB_PORT", "4444")
@@ -152,15 +688,46 @@ def driver(request) -> Generator[webdriver.Remote, None, None]:
                 command_executor=selenium_grid_url, options=firefox_options
             )
 
-            allure.attach(
-                f"Browser: Firefox\nMode: Remote\nOptions: {firefox_options.arguments}",
-                name="Browser Configuration",
-                attachment_type=allure.attachment_type.TEXT,
+            description = (
+                f"Browser: Firefox\nMode: Remote\nOptions: {firefox_options.arguments}"
             )
         else:
             raise ValueError(f"Unsupported browser: {browser}")
 
     driver.maximize_window()
+    return driver, browser, description
+
+
+@pytest.fixture(scope="session")
+def driver_pool(request) -> Generator[DriverPool, None, None]:
+    # Session scope under xdist is per worker, so sessions are never shared
+    pool = DriverPool(
+        lambda browser: _start_driver(request.config, browser),
+        recycle_after=request.config.getoption("--driver-recycle-after"),
+    )
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="function")
+def driver(request, driver_pool) -> Generator[webdriver.Remote, None, None]:
+    requested_browser = request.config.getoption("--browser")
+    mode = request.config.getoption("--mode")
+
+    session = driver_pool.acquire(requested_browser)
+    clear_wait_times()
+    reset_element_cache_stats()
+    driver = session.driver
+    browser = session.browser
+    screenshots.start_test(driver)
+    resource_blocking.start_test(driver)
+
+    allure.attach(
+        f"{session.description}\n"
+        f"Session: test {session.uses} of {driver_pool.recycle_after}",
+        name="Browser Configuration",
+        attachment_type=allure.attachment_type.TEXT,
+    )
 
     request.node._browser = browser
     request.node._mode = mode
@@ -170,14 +737,85 @@ def driver(request) -> Generator[webdriver.Remote, None, None]:
 
     yield driver
 
-    if hasattr(request.node, "rep_call") and request.node.rep_call.failed:
-        allure.attach(
-            driver.get_screenshot_as_png(),
-            name="failure_screenshot",
-            attachment_type=allure.attachment_type.PNG,
+    # Reports must never keep a broken session in the pool for the next test
+    failed = hasattr(request.node, "rep_call") and request.node.rep_call.failed
+    try:
+        if has_wait_times():
+            allure.attach(
+                wait_time_report(),
+                name="Wait Times",
+                attachment_type=allure.attachment_type.TEXT,
+            )
+
+        cache_stats = element_cache_stats()
+        if any(cache_stats.values()):
+            allure.attach(
+                f"Hits (lookups saved): {cache_stats['hits']}\n"
+                f"Cached handles re-checked (no lookup saved): "
+                f"{cache_stats['checked']}\n"
+                f"Misses (resolved from the page): {cache_stats['misses']}\n"
+                f"Stale handles re-resolved: {cache_stats['stale']}",
+                name="Element Cache",
+                attachment_type=allure.attachment_type.TEXT,
+            )
+
+        resource_blocking.record_page(driver)
+        if resource_blocking.has_blocked():
+            allure.attach(
+                resource_blocking.report(),
+                name="Blocked Resources",
+                attachment_type=allure.attachment_type.TEXT,
+            )
+
+        if failed:
+            screenshots.capture(driver, "failure_screenshot", force=True)
+    except Exception:
+        failed = True
+        raise
+    finally:
+        screenshots.end_test()
+        # A failed test may leave the browser in any state, so it gets a new session
+        driver_pool.release(requested_browser, failed=failed)
+
+
+def pytest_sessionfinish(session, exitstatus) -> None:
+    # Final flush for deletes enqueued after the cleanup_registry fixture teardown
+    registry = session.config.stash.get(cleanup_registry_key, None)
+    if registry is not None:
+        registry.shutdown()
+    # Attachments and screenshots still queued for writing
+    attachment_logger = session.config.stash.get(attachment_logger_key, None)
+    if attachment_logger is not None:
+        attachment_logger.writer.flush()
+    # Resource sizes learned with blocking off, for later bytes saved estimates;
+    # workers hand theirs to the controller, the only process writing the cache
+    if hasattr(session.config, "workerinput"):
+        session.config.workeroutput["resource_sizes"] = resource_blocking.learned
+    elif resource_blocking.learned and hasattr(session.config, "cache"):
+        session.config.cache.set(
+            RESOURCE_SIZES_CACHE_KEY, resource_blocking.updated_sizes()
         )
+    profiler = session.config.stash.get(step_profiler_key, None)
+    if profiler is not None:
+        if hasattr(session.config, "workerinput"):
+            session.config.workeroutput["step_profile"] = profiler.spans
+        else:
+            write_profile(
+                profiler.spans,
+                session.config.getoption("--step-profile"),
+                session.config.getoption("--step-profile-format"),
+            )
 
-    driver.quit()
+
+def pytest_terminal_summary(terminalreporter, config) -> None:
+    profiler = config.stash.get(step_profiler_key, None)
+    if profiler is None or not profiler.spans:
+        return
+    terminalreporter.write_sep("-", "top self-time steps")
+    terminalreporter.write_line(self_time_table(profiler.spans))
+    terminalreporter.write_line(
+        f"Step profile written to {config.getoption('--step-profile')}"
+    )
 
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
@@ -193,3 +831,9 @@ def pytest_runtest_makereport(item, call) -> None:
             name="Exception Info",
             attachment_type=allure.attachment_type.TEXT,
         )
+
+    if get_http_log_mode() == "on-failure":
+        if rep.failed:
+            flush_http_log()
+        elif rep.when == "teardown":
+            clear_http_log()
@@ -1,5 +1,6 @@
-from pydantic import BaseModel
-from typing import List
+from functools import lru_cache
+from pydantic import BaseModel, TypeAdapter
+from typing import Any, List
 
 
 class Addition(BaseModel):
@@ -34,3 +35,14 @@ class EntityResponse(BaseModel):
 
 class IdPerson(BaseModel):
     id: int
+
+
+@lru_cache(maxsize=None)
+def validator_for(model_type: Any) -> TypeAdapter:
+    """Return a validator for the type, built on first use and reused afterwards."""
+    return TypeAdapter(model_type)
+
+
+# Build the validators of the API responses at import, not on the first request
+for _model_type in (int, IdPerson, ExportData, EntityResponse):
+    validator_for(_model_type)
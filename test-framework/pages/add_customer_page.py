@@ -11,16 +11,24 @@ class AddCustomerPage(BasePage):
 
     @allure.step("Fill customer form with First Name: {first_name}, Last Name: {last_name}, Post Code: {post_code}")
     def fill_customer_form(self, first_name: str, last_name: str, post_code: str) -> 'AddCustomerPage':
-        self.input_text(self.FIRST_NAME_INPUT, first_name)
-        self.input_text(self.LAST_NAME_INPUT, last_name)
-        self.input_text(self.POST_CODE_INPUT, post_code)
+        (
+            self.batch()
+            .set_value(self.FIRST_NAME_INPUT, first_name)
+            .set_value(self.LAST_NAME_INPUT, last_name)
+            .set_value(self.POST_CODE_INPUT, post_code)
+            .run()
+        )
         self.take_screenshot("filled_customer_form")
 
     @allure.step("Verify form inputs - First Name: {first_name}, Last Name: {last_name}, Post Code: {post_code}")
     def verify_form_inputs(self, first_name: str, last_name: str, post_code: str) -> 'AddCustomerPage':
-        first_name_value = self.get_element_value(self.FIRST_NAME_INPUT)
-        last_name_value = self.get_element_value(self.LAST_NAME_INPUT)
-        post_code_value = self.get_element_value(self.POST_CODE_INPUT)
+        first_name_value, last_name_value, post_code_value = (
+            self.batch()
+            .get_value(self.FIRST_NAME_INPUT)
+            .get_value(self.LAST_NAME_INPUT)
+            .get_value(self.POST_CODE_INPUT)
+            .run()
+        )
         
         assert first_name_value == first_name, f"Expected First Name: '{first_name}', but got '{first_name_value}'"
         assert last_name_value == last_name, f"Expected Last Name: '{last_name}', but got '{last_name_value}'"
@@ -1,49 +1,278 @@
 import allure
-from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import (
+    TimeoutException,
+    StaleElementReferenceException,
+    ElementNotInteractableException,
+    ElementClickInterceptedException,
+)
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.common.by import By
-from typing import List, Union, Optional
+from typing import Any, Callable, Dict, List, Union, Optional
+from utils.adaptive_wait import AdaptiveWait
+from utils.screenshots import screenshots
+from utils.resource_blocking import resource_blocking
+
+# Element cache counters of the running test
+_element_cache_stats: Dict[str, int] = {
+    "hits": 0,
+    "checked": 0,
+    "misses": 0,
+    "stale": 0,
+}
+
+# Runs queued reads and writes in order. Returns null, without touching the
+# page, while any element is missing or a written field is not interactable
+BATCH_SCRIPT = """
+const ops = arguments[0];
+function find(by, value) {
+    switch (by) {
+        case 'css selector': return document.querySelector(value);
+        case 'xpath': return document.evaluate(
+            value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+        ).singleNodeValue;
+        case 'id': return document.getElementById(value);
+        case 'name': return document.getElementsByName(value)[0] || null;
+        case 'tag name': return document.getElementsByTagName(value)[0] || null;
+        case 'class name': return document.getElementsByClassName(value)[0] || null;
+    }
+    throw new Error('Unsupported locator strategy: ' + by);
+}
+const elements = [];
+for (const op of ops) {
+    const element = find(op.by, op.value);
+    if (!element) return null;
+    if (op.kind === 'set' &&
+        (element.disabled || element.readOnly || !element.getClientRects().length)) {
+        return null;
+    }
+    elements.push(element);
+}
+return {results: ops.map((op, i) => {
+    const element = elements[i];
+    if (op.kind === 'set') {
+        // The native setter keeps framework value trackers in sync
+        const descriptor = Object.getOwnPropertyDescriptor(
+            Object.getPrototypeOf(element), 'value'
+        );
+        if (descriptor && descriptor.set) {
+            descriptor.set.call(element, op.arg);
+        } else {
+            element.value = op.arg;
+        }
+        element.dispatchEvent(new Event('input', {bubbles: true}));
+        element.dispatchEvent(new Event('change', {bubbles: true}));
+        return null;
+    }
+    if (op.kind === 'value') return element.value;
+    return element.getAttribute(op.arg);
+})};
+"""
+
+
+class PageBatch:
+    """Reads and writes queued on a page and sent to the browser as one command.
+
+    set_value(..., keystrokes=True) is typed with send_keys instead, for
+    fields that react to real key events; the commands around it still run
+    in as few scripts as possible. run() returns the read results in order.
+    """
+
+    def __init__(self, page: "BasePage"):
+        self.page = page
+        self._ops: List[Dict[str, Any]] = []
+
+    def _queue(self, kind: str, locator: tuple, arg: Any = None) -> "PageBatch":
+        self._ops.append(
+            {"kind": kind, "by": locator[0], "value": locator[1], "arg": arg}
+        )
+        return self
+
+    def set_value(
+        self, locator: tuple, value: str, keystrokes: bool = False
+    ) -> "PageBatch":
+        return self._queue("type" if keystrokes else "set", locator, value)
+
+    def get_value(self, locator: tuple) -> "PageBatch":
+        return self._queue("value", locator)
+
+    def get_attribute(self, locator: tuple, name: str) -> "PageBatch":
+        return self._queue("attribute", locator, name)
+
+    def run(self) -> List[Any]:
+        ops, self._ops = self._ops, []
+        results: List[Any] = []
+        with allure.step(f"Run {len(ops)} batched browser commands"):
+            segment: List[Dict[str, Any]] = []
+            for op in ops + [None]:
+                if op is not None and op["kind"] != "type":
+                    segment.append(op)
+                    continue
+                if segment:
+                    results.extend(self._run_script(segment))
+                    segment = []
+                if op is not None:
+                    self.page.input_text((op["by"], op["value"]), op["arg"])
+        return results
+
+    def _run_script(self, ops: List[Dict[str, Any]]) -> List[Any]:
+        writes = any(op["kind"] == "set" for op in ops)
+        response = self.page.wait.until(
+            lambda driver: driver.execute_script(BATCH_SCRIPT, ops),
+            condition="clickable" if writes else "present",
+            label="batch " + ", ".join(str((op["by"], op["value"])) for op in ops),
+        )
+        return [
+            result
+            for op, result in zip(ops, response["results"])
+            if op["kind"] != "set"
+        ]
+
+
+def element_cache_stats() -> Dict[str, int]:
+    return dict(_element_cache_stats)
+
+
+def reset_element_cache_stats() -> None:
+    for key in _element_cache_stats:
+        _element_cache_stats[key] = 0
+
+
+def _checked_element(element: WebElement) -> WebElement:
+    # A round trip as costly as the lookup, so a stale handle is not returned
+    element.tag_name
+    return element
+
 
 class BasePage:
     def __init__(self, driver):
         self.driver = driver
-        self.driver.implicitly_wait(15)
-        self.wait: WebDriverWait = WebDriverWait(driver, 15, poll_frequency=1)
+        # Explicit waits only: with an implicit wait every failed poll and
+        # every negative check would block for the whole implicit timeout
+        self.driver.implicitly_wait(0)
+        self.wait: AdaptiveWait = AdaptiveWait(driver)
+        # Resolved elements by locator, dropped on navigation or when stale
+        self._elements: Dict[tuple, WebElement] = {}
+
+    def open(self, url: str) -> None:
+        """Navigate to url; elements resolved on the previous page are forgotten"""
+        resource_blocking.record_page(self.driver)
+        self.driver.get(url)
+        self.invalidate_elements()
+
+    def reload(self) -> None:
+        """Reload the current page, e.g. to make the app re-read its stored state"""
+        resource_blocking.record_page(self.driver)
+        self.driver.refresh()
+        self.invalidate_elements()
+
+    def invalidate_elements(self) -> None:
+        self._elements.clear()
+
+    def _with_element(
+        self,
+        locator: tuple,
+        action: Callable[[WebElement], Any],
+        condition: str,
+        timeout: Optional[float] = None,
+        counter: str = "hits",
+    ) -> Any:
+        """Run action on the cached element, resolving it again if missing or stale.
+
+        A cached element skips the lookup, a "clickable" one is still
+        checked to be displayed and enabled once. If it is stale, or not
+        clickable or interactable at the moment, it is resolved again
+        through the condition wait, exactly as an uncached one. Cache use
+        is counted as `counter`, "hits" for lookups saved.
+        """
+        element = self._elements.get(locator)
+        if element is not None:
+            try:
+                if condition != "clickable" or EC.element_to_be_clickable(element)(
+                    self.driver
+                ):
+                    result = action(element)
+                    _element_cache_stats[counter] += 1
+                    return result
+            except StaleElementReferenceException:
+                _element_cache_stats["stale"] += 1
+                del self._elements[locator]
+            except (ElementNotInteractableException, ElementClickInterceptedException):
+                del self._elements[locator]
+
+        expected = {
+            "present": EC.presence_of_element_located,
+            "clickable": EC.element_to_be_clickable,
+        }[condition]
+        element = self.wait.until(
+            expected(locator), condition=condition, label=str(locator), timeout=timeout
+        )
+        _element_cache_stats["misses"] += 1
+        self._elements[locator] = element
+        return action(element)
+
+    def batch(self) -> PageBatch:
+        """Start a batch of reads and writes sent to the browser as one command"""
+        return PageBatch(self)
 
     @allure.step("Find element with locator: {locator}")
-    def find_element(self, locator: Union[str, tuple[By, str]]) -> WebElement:
-        return self.driver.find_element(*locator)
+    def find_element(
+        self, locator: Union[str, tuple[By, str]], timeout: Optional[float] = None
+    ) -> WebElement:
+        # The liveness check costs the lookup it replaces, so it is no hit
+        return self._with_element(
+            locator, _checked_element, "present", timeout, counter="checked"
+        )
 
     @allure.step("Find elements with locator: {locator}")
-    def find_elements(self, locator: Union[str, tuple[By, str]]) -> List[WebElement]:
-        return self.driver.find_elements(*locator)
+    def find_elements(
+        self, locator: Union[str, tuple[By, str]], timeout: Optional[float] = None
+    ) -> List[WebElement]:
+        """Wait for at least one element; timeout=0 checks once, for negative checks"""
+        if timeout == 0:
+            return self.driver.find_elements(*locator)
+        try:
+            return self.wait.until(
+                EC.presence_of_all_elements_located(locator),
+                condition="present",
+                label=str(locator),
+                timeout=timeout,
+            )
+        except TimeoutException:
+            return []
 
     @allure.step("Click element with locator: {locator}")
-    def click_element(self, locator: Union[str, tuple[By, str]]) -> None:
-        element: WebElement = self.wait.until(EC.element_to_be_clickable(locator))
-        element.click()
+    def click_element(
+        self, locator: Union[str, tuple[By, str]], timeout: Optional[float] = None
+    ) -> None:
+        self._with_element(locator, lambda element: element.click(), "clickable", timeout)
 
     @allure.step("Input text: '{text}' into element with locator: {locator}")
-    def input_text(self, locator: Union[str, tuple[By, str]], text: str) -> None:
-        element: WebElement = self.wait.until(EC.element_to_be_clickable(locator))
-        element.send_keys(text)
+    def input_text(
+        self,
+        locator: Union[str, tuple[By, str]],
+        text: str,
+        timeout: Optional[float] = None,
+    ) -> None:
+        self._with_element(
+            locator, lambda element: element.send_keys(text), "clickable", timeout
+        )
 
     @allure.step("Get value from element with locator: {locator}")
     def get_element_value(self, locator: Union[str, tuple[By, str]]) -> Optional[str]:
-        return self.find_element(locator).get_attribute("value")
+        return self._with_element(
+            locator, lambda element: element.get_attribute("value"), "present"
+        )
 
     @allure.step("Wait for alert, get text and accept")
-    def wait_for_alert_and_accept(self) -> str:
-        alert = self.wait.until(EC.alert_is_present())
+    def wait_for_alert_and_accept(self, timeout: Optional[float] = None) -> str:
+        alert = self.wait.until(
+            EC.alert_is_present(), condition="alert", label="alert", timeout=timeout
+        )
         alert_text: str = alert.text
         alert.accept()
         return alert_text
         
-    @allure.step("Take screenshot")
     def take_screenshot(self, name: str = "screenshot") -> None:
-        allure.attach(
-            self.driver.get_screenshot_as_png(),
-            name=name,
-            attachment_type=allure.attachment_type.PNG
-        )
\ No newline at end of file
+        # Captured only with the "always" policy, written in the background
+        screenshots.take(self.driver, name)
\ No newline at end of file
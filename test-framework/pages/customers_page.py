@@ -1,32 +1,77 @@
 import allure
 from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
 from pages.base_page import BasePage
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
+
+# Reads every data row of the table with the delete button of each row,
+# or returns null while the table is not rendered yet
+READ_TABLE_SCRIPT = """
+const table = document.querySelector(arguments[0]);
+if (!table) return null;
+const rows = [];
+for (const row of Array.from(table.rows).slice(1)) {
+    const cells = Array.from(row.querySelectorAll('td'));
+    if (!cells.length) continue;
+    rows.push({
+        cells: cells.map(cell => cell.innerText.trim()),
+        deleteButton: row.querySelector(arguments[1]),
+    });
+}
+return {rows: rows};
+"""
+
+
+class CustomersTable:
+    """Snapshot of the customers table: cell texts and delete buttons by row"""
+
+    def __init__(self, rows: List[Dict[str, Any]]):
+        self.rows: List[List[str]] = [row["cells"] for row in rows]
+        self.delete_buttons: List[Optional[WebElement]] = [
+            row["deleteButton"] for row in rows
+        ]
+
+    def column(self, index: int) -> List[str]:
+        return [cells[index] if index < len(cells) else "" for cells in self.rows]
+
 
 class CustomersPage(BasePage):
     SORT_BY_NAME_BUTTON = (By.XPATH, '//*[contains(@ng-click, "fName")]')
     CUSTOMERS_TABLE = (By.CSS_SELECTOR, 'table[class="table table-bordered table-striped"]')
-    TABLE_ROWS = (By.TAG_NAME, "tr")
-    TABLE_COLUMNS = (By.TAG_NAME, "td")
-    DELETE_BUTTONS = (By.XPATH, "//*[@ng-click='deleteCust(cust)']")
+    DELETE_BUTTONS = (By.CSS_SELECTOR, "[ng-click='deleteCust(cust)']")
+
+    def __init__(self, driver):
+        super().__init__(driver)
+        self._table: Optional[CustomersTable] = None
 
     @allure.step("Sort customers by name")
     def sort_by_name(self) -> 'CustomersPage':
         self.click_element(self.SORT_BY_NAME_BUTTON)
+        self.invalidate_table()
         self.take_screenshot("sorted_customers")
 
+    def read_table(self) -> CustomersTable:
+        """Return the table snapshot, reading it in one script call if it changed"""
+        if self._table is None:
+            table = self.wait.until(
+                lambda driver: driver.execute_script(
+                    READ_TABLE_SCRIPT,
+                    self.CUSTOMERS_TABLE[1],
+                    self.DELETE_BUTTONS[1],
+                ),
+                condition="present",
+                label=str(self.CUSTOMERS_TABLE),
+            )
+            self._table = CustomersTable(table["rows"])
+        return self._table
+
+    def invalidate_table(self) -> None:
+        """Drop the snapshot after an action that changes the table"""
+        self._table = None
+
     @allure.step("Get first column data from customers table")
     def get_first_column_data(self) -> List[str]:
-        table = self.find_element(self.CUSTOMERS_TABLE)
-        rows = table.find_elements(*self.TABLE_ROWS)
-        rows = rows[1:]
-
-        first_column_data = []
-        for row in rows:
-            cells = row.find_elements(*self.TABLE_COLUMNS)
-            if cells:
-                first_cell = cells[0]
-                first_column_data.append(first_cell.text)
+        first_column_data = self.read_table().column(0)
 
         allure.attach(
             "\n".join(first_column_data), 
@@ -67,12 +112,17 @@ class CustomersPage(BasePage):
                     attachment_type=allure.attachment_type.TEXT
                 )
 
-        delete_buttons = self.find_elements(self.DELETE_BUTTONS)
+        delete_buttons = self.read_table().delete_buttons
         expected_names = first_column_data.copy()
 
-        if index_to_delete is not None and index_to_delete < len(delete_buttons):
+        if (
+            index_to_delete is not None
+            and index_to_delete < len(delete_buttons)
+            and delete_buttons[index_to_delete] is not None
+        ):
             with allure.step(f"Delete customer at index {index_to_delete}: {expected_names[index_to_delete]}"):
                 delete_buttons[index_to_delete].click()
+                self.invalidate_table()
                 del expected_names[index_to_delete]
 
         self.take_screenshot("after_deletion")
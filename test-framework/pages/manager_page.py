@@ -1,11 +1,38 @@
 import allure
 from selenium.webdriver.common.by import By
 from pages.base_page import BasePage
-from typing import Type
+from typing import List, Tuple, Type
+
+# Adds customers to the banking app's localStorage state in one call:
+# arguments[0] is the storage key, arguments[1] a list of
+# [first name, last name, post code]. Returns the stored customer count
+SEED_CUSTOMERS_SCRIPT = """
+const users = JSON.parse(localStorage.getItem(arguments[0]) || '{}');
+let nextId = 1;
+for (const id of Object.keys(users)) {
+    nextId = Math.max(nextId, Number(id) + 1);
+}
+const date = new Date();
+for (const [fName, lName, postCd] of arguments[1]) {
+    users[nextId] = {
+        id: nextId, fName: fName, lName: lName, postCd: postCd,
+        accountNo: [], date: date,
+    };
+    nextId++;
+}
+localStorage.setItem(arguments[0], JSON.stringify(users));
+return Object.keys(users).length;
+"""
+
+COUNT_CUSTOMERS_SCRIPT = """
+return Object.keys(JSON.parse(localStorage.getItem(arguments[0]) || '{}')).length;
+"""
 
 class ManagerPage(BasePage):
     ADD_CUSTOMER_BUTTON = (By.CSS_SELECTOR, 'button[ng-class="btnClass1"]')
     CUSTOMERS_BUTTON = (By.CSS_SELECTOR, 'button[ng-class="btnClass3"]')
+    # localStorage key of the app's customers, an object keyed by customer id
+    CUSTOMERS_STORAGE_KEY = "User"
 
     def __init__(self, driver):
         super().__init__(driver)
@@ -13,7 +40,33 @@ class ManagerPage(BasePage):
 
     @allure.step("Navigate to Manager Page")
     def navigate_to(self) -> 'ManagerPage':
-        self.driver.get(self.url)
+        self.open(self.url)
+        return self
+
+    @allure.step("Seed customers into the application state")
+    def seed_customers(self, customers: List[Tuple[str, str, str]]) -> 'ManagerPage':
+        """Add (first name, last name, post code) customers without the add form.
+
+        The customers are written to the app's localStorage in one script
+        call and the page is reloaded, so the app reads them back. Must be
+        called after navigate_to, on the app's origin.
+        """
+        stored = self.driver.execute_script(
+            SEED_CUSTOMERS_SCRIPT, self.CUSTOMERS_STORAGE_KEY, customers
+        )
+        self.reload()
+        # The app would replace unreadable state with its default customers
+        kept = self.driver.execute_script(
+            COUNT_CUSTOMERS_SCRIPT, self.CUSTOMERS_STORAGE_KEY
+        )
+        assert kept == stored, (
+            f"Seeded {len(customers)} customers, but the app kept {kept} of {stored}"
+        )
+        allure.attach(
+            f"Seeded: {len(customers)}\nStored customers: {stored}",
+            name="Seeded Customers",
+            attachment_type=allure.attachment_type.TEXT,
+        )
         return self
 
     @allure.step("Click Add Customer button")
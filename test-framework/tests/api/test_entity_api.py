@@ -1,6 +1,6 @@
 import allure
 import pytest
-from models.entity_models import IdPerson, ExportData, EntityResponse
+from models.entity_models import IdPerson
 
 
 @pytest.mark.api
@@ -10,7 +10,7 @@ class TestEntityAPI:
     @allure.story("Entity Creation")
     @allure.severity(allure.severity_level.CRITICAL)
     @allure.description("Test creating a new entity and verifying it exists")
-    def test_create_entity(self, api_client, json_data):
+    def test_create_entity(self, api_client, json_data, cleanup_registry):
         # Create an entity
         with allure.step("Create new entity with test data"):
             entity_id = api_client.create_entity(json_data)
@@ -24,22 +24,20 @@ class TestEntityAPI:
 
             # Get the entity to verify it was created correctly
             with allure.step("Retrieve the created entity"):
-                entity_data, status_code = api_client.get_entity(entity_id)
-                entity_pydantic = ExportData.model_validate(entity_data)
-                entity_dict = entity_pydantic.model_dump()
+                entity_pydantic, status_code = api_client.get_entity_model(entity_id)
 
-            # Remove ID fields for comparison
+            # Compare ignoring ID fields
             with allure.step("Compare entity data with original test data"):
-                clean_data = api_client.remove_id_keys(entity_dict, entity_id, True)
-
                 # Verify the entity data
                 assert status_code == 200
-                assert clean_data == json_data
+                api_client.assert_equal_ignoring_ids(
+                    entity_pydantic, json_data, entity_id, True
+                )
 
         finally:
             # Clean up
-            with allure.step("Clean up - delete the created entity"):
-                api_client.delete_entity(entity_id)
+            with allure.step("Clean up - schedule deletion of the created entity"):
+                cleanup_registry.enqueue(entity_id)
 
     @allure.story("Entity Deletion")
     @allure.severity(allure.severity_level.CRITICAL)
@@ -64,49 +62,43 @@ class TestEntityAPI:
     @allure.story("Entity Retrieval")
     @allure.severity(allure.severity_level.NORMAL)
     @allure.description("Test retrieving an entity by ID")
-    def test_get_entity(self, api_client, created_entity_id, json_data):
+    def test_get_entity(self, api_client, pooled_entity):
         # Get the entity
-        with allure.step(f"Retrieve entity with ID {created_entity_id}"):
-            entity_data, status_code = api_client.get_entity(created_entity_id)
+        with allure.step(f"Retrieve entity with ID {pooled_entity.entity_id}"):
+            entity_pydantic, status_code = api_client.get_entity_model(
+                pooled_entity.entity_id
+            )
 
         # Validate the response
         with allure.step("Validate the retrieved entity data"):
-            entity_pydantic = ExportData.model_validate(entity_data)
-            entity_dict = entity_pydantic.model_dump()
-
-            # Remove ID fields for comparison
-            clean_data = api_client.remove_id_keys(entity_dict, created_entity_id, True)
-
-            # Verify the data
+            # Verify the data, ignoring ID fields
             assert status_code == 200
-            assert clean_data == json_data
+            api_client.assert_equal_ignoring_ids(
+                entity_pydantic, pooled_entity.data, pooled_entity.entity_id, True
+            )
 
     @allure.story("Entity List Retrieval")
     @allure.severity(allure.severity_level.NORMAL)
     @allure.description("Test retrieving all entities and finding a specific one")
-    def test_get_all_entities(self, api_client, created_entity_id, json_data):
-        # Get all entities
-        with allure.step("Retrieve all entities"):
-            entities_data, status_code = api_client.get_all_entities()
-
-        # Validate the response format
-        with allure.step("Validate the response format"):
-            entities_pydantic = EntityResponse.model_validate(entities_data)
-
-            # Check if our created entity is in the list
-            found = False
-            entity_count = len(entities_pydantic.entity)
-            allure.attach(str(entity_count), "Total entities found")
-
-            for entity in entities_pydantic.entity:
-                entity_dict = entity.model_dump()
-                entity_without_id = api_client.remove_id_keys(entity_dict)
-                if entity_without_id == json_data:
-                    found = True
-                    break
-
+    def test_get_all_entities(self, api_client, pooled_entity, entity_pool):
+        # Get all entities once and index them by content
+        with allure.step("Retrieve and index all entities"):
+            index, status_code = api_client.build_entity_index()
             assert status_code == 200
-            assert found, "Created entity not found in the list of all entities"
+
+        # Check that our entities are in the list
+        with allure.step("Verify the pooled entities are in the list"):
+            assert pooled_entity.entity_id in index.ids_for(pooled_entity.data), (
+                "Created entity not found in the list of all entities"
+            )
+
+            pooled = entity_pool.entities()
+            missing = [
+                entity_id
+                for entity_id, data in pooled.items()
+                if entity_id not in index.ids_for(data)
+            ]
+            assert not missing, f"Pooled entities not found in the list: {missing}"
 
     @allure.story("Entity Update")
     @allure.severity(allure.severity_level.CRITICAL)
@@ -121,13 +113,13 @@ class TestEntityAPI:
 
         # Get the updated entity
         with allure.step("Retrieve the updated entity"):
-            entity_data, status_code = api_client.get_entity(created_entity_id)
-            entity_pydantic = ExportData.model_validate(entity_data)
-            entity_dict = entity_pydantic.model_dump()
-
-            # Remove ID fields for comparison
-            clean_data = api_client.remove_id_keys(entity_dict, created_entity_id, True)
+            entity_pydantic, status_code = api_client.get_entity_model(
+                created_entity_id
+            )
+            assert status_code == 200
 
-        # Verify the update
+        # Verify the update, ignoring ID fields
         with allure.step("Verify the entity was updated correctly"):
-            assert clean_data == json_data_for_patch
+            api_client.assert_equal_ignoring_ids(
+                entity_pydantic, json_data_for_patch, created_entity_id, True
+            )
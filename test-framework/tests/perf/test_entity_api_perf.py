@@ -0,0 +1,112 @@
+import asyncio
+import json
+import allure
+import pytest
+from api.async_entity_api import AsyncEntityAPI
+from utils.allure_utils import http_log_mode
+from utils.data_generator_for_api import generate_entity_data
+from utils.latency_stats import measure, find_regressions, render_histogram_svg
+
+
+async def _bulk_create(base_url, payloads):
+    async with AsyncEntityAPI(base_url) as client:
+        return await client.bulk_create(payloads)
+
+
+@pytest.mark.perf
+@allure.epic("Entity API")
+@allure.feature("Entity API Performance")
+class TestEntityAPIPerformance:
+    @allure.story("Endpoint Latency")
+    @allure.severity(allure.severity_level.NORMAL)
+    @allure.description(
+        "Measure latency percentiles and throughput of an Entity API endpoint"
+    )
+    @pytest.mark.parametrize("endpoint", ["create", "get", "getAll", "patch", "delete"])
+    def test_endpoint_latency(
+        self,
+        request,
+        api_session_client,
+        cleanup_registry,
+        perf_report,
+        perf_baseline,
+        endpoint,
+    ):
+        iterations = request.config.getoption("--perf-iterations")
+        warmup = request.config.getoption("--perf-warmup")
+        total = iterations + warmup
+        client = api_session_client
+
+        # Prepare the data the timed requests consume
+        with allure.step(f"Prepare data for {total} requests"), http_log_mode("off"):
+            payloads = [generate_entity_data() for _ in range(total)]
+            entity_ids = []
+            if endpoint == "delete":
+                entity_ids = asyncio.run(_bulk_create(client.base_url, payloads))
+            elif endpoint in ("get", "patch"):
+                entity_ids = [client.create_entity(payloads[0])]
+            created = []
+            deleted = set()
+
+        def create(i):
+            response = client.send("POST", "/api/create", json=payloads[i])
+            response.raise_for_status()
+            created.append(response.json())
+
+        def get(i):
+            client.send("GET", f"/api/get/{entity_ids[0]}").raise_for_status()
+
+        def get_all(i):
+            client.send("GET", "/api/getAll").raise_for_status()
+
+        def patch(i):
+            client.send(
+                "PATCH", f"/api/patch/{entity_ids[0]}", json=payloads[i]
+            ).raise_for_status()
+
+        def delete(i):
+            client.send("DELETE", f"/api/delete/{entity_ids[i]}").raise_for_status()
+            deleted.add(entity_ids[i])
+
+        operations = {
+            "create": create,
+            "get": get,
+            "getAll": get_all,
+            "patch": patch,
+            "delete": delete,
+        }
+
+        # Run the benchmark
+        with allure.step(f"Send {warmup} warmup and {iterations} timed requests"):
+            try:
+                stats = measure(endpoint, operations[endpoint], iterations, warmup)
+            finally:
+                # Everything not deleted by the benchmark itself, also on failure;
+                # enqueued only now, so background deletes cannot race the requests
+                for entity_id in created + entity_ids:
+                    if entity_id not in deleted:
+                        cleanup_registry.enqueue(entity_id)
+
+        summary = stats.summary()
+        perf_report[endpoint] = summary
+
+        with allure.step("Report latency"):
+            allure.attach(
+                json.dumps(summary, indent=2),
+                f"{endpoint} latency",
+                allure.attachment_type.JSON,
+            )
+            allure.attach(
+                render_histogram_svg(stats),
+                f"{endpoint} latency histogram",
+                allure.attachment_type.SVG,
+            )
+
+        # Compare with the previous run
+        with allure.step("Compare with the baseline"):
+            regressions = find_regressions(
+                {endpoint: summary},
+                perf_baseline,
+                request.config.getoption("--perf-max-regression"),
+            )
+            assert not regressions, "Latency regressions: " + "; ".join(regressions)
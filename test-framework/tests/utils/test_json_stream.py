@@ -0,0 +1,46 @@
+import json
+import allure
+import pytest
+from utils.json_stream import iter_array_items
+
+
+def _chunks(data: bytes, size: int):
+    return (data[i : i + size] for i in range(0, len(data), size))
+
+
+@pytest.mark.api
+@allure.epic("Entity API")
+@allure.feature("Streamed getAll parsing")
+class TestJsonStream:
+    @allure.story("Chunk boundaries")
+    @allure.description("Test items split at every byte, inside numbers and strings")
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 4096])
+    def test_items_split_across_chunks(self, chunk_size):
+        items = [
+            4500.0,
+            1e5,
+            -12,
+            3.25e-2,
+            0,
+            "Ünïcödé ✓ 😀",
+            {"id": 1, "important_numbers": [1, 22, 333], "verified": True},
+            None,
+            [],
+        ]
+        body = json.dumps({"version": 2, "entity": items}, ensure_ascii=False)
+
+        with allure.step(f"Parse the body in {chunk_size}-byte chunks"):
+            parsed = list(
+                iter_array_items(_chunks(body.encode("utf-8"), chunk_size), "entity")
+            )
+
+        assert parsed == items
+
+    @allure.story("Invalid input")
+    @allure.description("Test that cut or malformed arrays raise instead of yielding")
+    @pytest.mark.parametrize(
+        "body", [b'{"entity": [1, 2', b'{"entity": [4500.]}', b'{"other": [1]}']
+    )
+    def test_invalid_stream_raises(self, body):
+        with pytest.raises(ValueError):
+            list(iter_array_items(_chunks(body, 1), "entity"))
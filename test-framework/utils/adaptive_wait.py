@@ -0,0 +1,111 @@
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
+
+
+DEFAULT_WAIT_TIMEOUT = 15.0
+# Timeouts per condition, in seconds; conditions not listed use the default
+CONDITION_TIMEOUTS: Dict[str, float] = {
+    "present": 15.0,
+    "visible": 15.0,
+    "clickable": 15.0,
+    "alert": 10.0,
+}
+INITIAL_POLL_INTERVAL = 0.005
+MAX_POLL_INTERVAL = 0.5
+POLL_BACKOFF = 2.0
+IGNORED_EXCEPTIONS = (NoSuchElementException, StaleElementReferenceException)
+
+# Wait times of the running test: label -> [(seconds, timed out), ...]
+_wait_times: Dict[str, List[Tuple[float, bool]]] = {}
+
+
+class AdaptiveWait:
+    """Explicit wait polling with exponential backoff instead of a fixed interval.
+
+    The first check happens immediately and the following ones after 5ms,
+    10ms, 20ms ... up to MAX_POLL_INTERVAL, so fast conditions return almost
+    at once while slow ones do not flood the driver with commands. Every wait
+    is recorded under its label for the per-test wait time report.
+    """
+
+    def __init__(
+        self,
+        driver: Any,
+        timeout: Optional[float] = None,
+        initial_poll: float = INITIAL_POLL_INTERVAL,
+        max_poll: float = MAX_POLL_INTERVAL,
+    ):
+        self.driver = driver
+        self.timeout = timeout
+        self.initial_poll = initial_poll
+        self.max_poll = max_poll
+
+    def until(
+        self,
+        method: Callable[[Any], Any],
+        message: str = "",
+        condition: str = "",
+        label: str = "",
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """Poll method(driver) until it returns a truthy value and return it."""
+        if timeout is None:
+            timeout = self.timeout
+        if timeout is None:
+            timeout = CONDITION_TIMEOUTS.get(condition, DEFAULT_WAIT_TIMEOUT)
+
+        started = time.monotonic()
+        deadline = started + timeout
+        interval = self.initial_poll
+        while True:
+            try:
+                value = method(self.driver)
+                if value:
+                    record_wait(label or condition, time.monotonic() - started)
+                    return value
+            except IGNORED_EXCEPTIONS:
+                pass
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                record_wait(label or condition, time.monotonic() - started, True)
+                raise TimeoutException(
+                    message
+                    or f"Timed out after {timeout}s waiting for {label or condition}"
+                )
+            time.sleep(min(interval, remaining))
+            interval = min(interval * POLL_BACKOFF, self.max_poll)
+
+
+def record_wait(label: str, seconds: float, timed_out: bool = False) -> None:
+    _wait_times.setdefault(label or "unnamed", []).append((seconds, timed_out))
+
+
+def wait_time_report() -> str:
+    """Return the waits of the running test as a table, slowest labels first."""
+    rows = []
+    for label, waits in _wait_times.items():
+        total = sum(seconds for seconds, _ in waits)
+        rows.append(
+            (
+                total,
+                f"{total * 1000:>9.1f} {max(s for s, _ in waits) * 1000:>9.1f} "
+                f"{len(waits):>5} {sum(t for _, t in waits):>8}  {label}",
+            )
+        )
+    rows.sort(reverse=True)
+    header = f"{'total ms':>9} {'max ms':>9} {'waits':>5} {'timeouts':>8}  locator"
+    return "\n".join([header] + [row for _, row in rows])
+
+
+def has_wait_times() -> bool:
+    return bool(_wait_times)
+
+
+def clear_wait_times() -> None:
+    _wait_times.clear()
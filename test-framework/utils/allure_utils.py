@@ -1,9 +1,42 @@
 import allure
 import json
-from typing import Dict, Any, Optional
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, List, Tuple, Iterator
 import requests
 
 
+HTTP_LOG_MODES = ("off", "on-failure", "full")
+
+_http_log_mode = "full"
+# Raw request/response records of the running test, used in on-failure mode
+_http_log_buffer: List[Tuple[str, Tuple[Any, ...]]] = []
+
+
+def set_http_log_mode(mode: str) -> None:
+    """Select how HTTP traffic is logged: off, on-failure or full"""
+    global _http_log_mode
+    if mode not in HTTP_LOG_MODES:
+        raise ValueError(
+            f"Unsupported HTTP log mode: {mode}, expected one of {HTTP_LOG_MODES}"
+        )
+    _http_log_mode = mode
+
+
+def get_http_log_mode() -> str:
+    return _http_log_mode
+
+
+@contextmanager
+def http_log_mode(mode: str) -> Iterator[None]:
+    """Temporarily switch the HTTP logging mode, e.g. off around bulk setup"""
+    previous = get_http_log_mode()
+    set_http_log_mode(mode)
+    try:
+        yield
+    finally:
+        set_http_log_mode(previous)
+
+
 def allure_request_logger(
     method: str,
     url: str,
@@ -11,6 +44,62 @@ def allure_request_logger(
     data: Optional[Any] = None,
 ) -> None:
     """Log request details to Allure report"""
+    if _http_log_mode == "off":
+        return
+    if _http_log_mode == "on-failure":
+        _http_log_buffer.append(("request", (method, url, headers, data)))
+        return
+    _attach_request(method, url, headers, data)
+
+
+def allure_response_logger(response: requests.Response) -> None:
+    """Log response details to Allure report"""
+    if _http_log_mode == "off":
+        return
+    if _http_log_mode == "on-failure":
+        _http_log_buffer.append(("response", (response,)))
+        return
+    _attach_response(response)
+
+
+def allure_streamed_response_logger(response: requests.Response) -> None:
+    """Log status and headers of a response whose body is consumed as a stream"""
+    if _http_log_mode == "off":
+        return
+    if _http_log_mode == "on-failure":
+        _http_log_buffer.append(("streamed_response", (response,)))
+        return
+    _attach_streamed_response(response)
+
+
+def flush_http_log() -> None:
+    """Attach the buffered HTTP traffic of the current test and clear the buffer"""
+    records = list(_http_log_buffer)
+    _http_log_buffer.clear()
+    if not records:
+        return
+
+    with allure.step(f"HTTP log ({len(records)} records)"):
+        for kind, args in records:
+            if kind == "request":
+                _attach_request(*args)
+            elif kind == "streamed_response":
+                _attach_streamed_response(*args)
+            else:
+                _attach_response(*args)
+
+
+def clear_http_log() -> None:
+    """Drop the buffered HTTP traffic of the current test"""
+    _http_log_buffer.clear()
+
+
+def _attach_request(
+    method: str,
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    data: Optional[Any] = None,
+) -> None:
     with allure.step(f"Request: {method} {url}"):
         if headers:
             allure.attach(
@@ -26,21 +115,25 @@ def allure_request_logger(
             )
 
 
-def allure_response_logger(response: requests.Response) -> None:
-    """Log response details to Allure report"""
+def _attach_response(response: requests.Response) -> None:
     with allure.step(f"Response: Status Code {response.status_code}"):
-        try:
-            # Try to parse as JSON
-            response_body = response.json()
-            allure.attach(
-                json.dumps(response_body, indent=2),
-                "Response Body",
-                allure.attachment_type.JSON,
-            )
-        except Exception:
-            # If not JSON, attach as text
-            allure.attach(response.text, "Response Body", allure.attachment_type.TEXT)
+        # The body is attached as received, JSON is not parsed a second time
+        is_json = "json" in response.headers.get("Content-Type", "")
+        allure.attach(
+            response.text,
+            "Response Body",
+            allure.attachment_type.JSON if is_json else allure.attachment_type.TEXT,
+        )
+
+        allure.attach(
+            json.dumps(dict(response.headers), indent=2),
+            "Response Headers",
+            allure.attachment_type.JSON,
+        )
+
 
+def _attach_streamed_response(response: requests.Response) -> None:
+    with allure.step(f"Response: Status Code {response.status_code} (streamed body)"):
         allure.attach(
             json.dumps(dict(response.headers), indent=2),
             "Response Headers",
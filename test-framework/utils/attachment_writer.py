@@ -0,0 +1,180 @@
+import gzip
+import queue
+import threading
+import time
+import warnings
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Union
+import allure_commons
+from allure_commons.logger import AllureFileLogger
+
+
+DEFAULT_BATCH_SIZE = 64
+DEFAULT_BATCH_WAIT = 0.02
+COMPRESSIBLE_EXTENSIONS = ("txt", "json", "xml", "html", "csv", "tsv", "yaml", "svg")
+
+_STOP = object()
+
+AttachmentBody = Union[bytes, str, Callable[[], bytes]]
+
+
+class AttachmentWriter:
+    """Background thread writing Allure attachment files in batches.
+
+    submit() only enqueues. The thread takes up to `batch_size` queued files,
+    waiting at most `batch_wait` seconds for more to arrive, and writes them
+    in one go. A callable body is called on the writer thread, so expensive
+    encoding can be deferred there as well.
+    """
+
+    def __init__(
+        self,
+        report_dir: Union[str, Path],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        batch_wait: float = DEFAULT_BATCH_WAIT,
+    ):
+        self.report_dir = Path(report_dir)
+        self.batch_size = max(1, batch_size)
+        self.batch_wait = batch_wait
+        self.files_written = 0
+        self.batches_written = 0
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._errors: List[str] = []
+        self._thread = threading.Thread(
+            target=self._run, name="allure-attachment-writer", daemon=True
+        )
+        self._thread.start()
+
+    def submit(
+        self, file_name: str, body: AttachmentBody, compress: bool = False
+    ) -> None:
+        self._queue.put((file_name, body, compress))
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.batch_wait
+            while len(batch) < self.batch_size and batch[-1] is not _STOP:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            files = [item for item in batch if item is not _STOP]
+            for file_name, body, compress in files:
+                self._write(file_name, body, compress)
+            if files:
+                self.batches_written += 1
+            for _ in batch:
+                self._queue.task_done()
+            if batch[-1] is _STOP:
+                return
+
+    def _write(self, file_name: str, body: AttachmentBody, compress: bool) -> None:
+        try:
+            if callable(body):
+                body = body()
+            if isinstance(body, str):
+                body = body.encode("utf-8")
+            if compress:
+                body = gzip.compress(body)
+            (self.report_dir / file_name).write_bytes(body)
+            self.files_written += 1
+        except Exception as error:
+            # Never let one attachment stop the thread, report at flush instead
+            self._errors.append(f"{file_name}: {error!r}")
+
+    def flush(self) -> None:
+        """Block until every submitted attachment is written"""
+        self._queue.join()
+        errors, self._errors = self._errors, []
+        for error in errors:
+            warnings.warn(f"Failed to write Allure attachment {error}")
+
+    def close(self) -> None:
+        self.flush()
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+
+
+class BackgroundAllureFileLogger(AllureFileLogger):
+    """AllureFileLogger that hands attachment files to an AttachmentWriter.
+
+    Text attachments of at least `gzip_min_size` characters are stored
+    gzip-compressed as .gz files (0 disables compression); Allure offers
+    them for download instead of showing them inline.
+    """
+
+    def __init__(
+        self,
+        report_dir: Union[str, Path],
+        writer: AttachmentWriter,
+        reporter: Optional[Any] = None,
+        gzip_min_size: int = 0,
+    ):
+        super().__init__(report_dir)
+        self.writer = writer
+        self.reporter = reporter
+        self.gzip_min_size = gzip_min_size
+        self.replaced: Optional[AllureFileLogger] = None
+
+    @allure_commons.hookimpl
+    def report_attached_data(self, body, file_name):
+        compress = (
+            self.gzip_min_size > 0
+            and len(body) >= self.gzip_min_size
+            and file_name.rsplit(".", 1)[-1] in COMPRESSIBLE_EXTENSIONS
+            and self._relabel_as_gzip(file_name)
+        )
+        self.writer.submit(f"{file_name}.gz" if compress else file_name, body, compress)
+
+    def _relabel_as_gzip(self, file_name: str) -> bool:
+        # The attachment was just linked to the current step or test
+        if self.reporter is None:
+            return False
+        item = self.reporter.get_item(self.reporter._last_executable())
+        for attachment in reversed(item.attachments if item else []):
+            if attachment.source == file_name:
+                attachment.source = f"{file_name}.gz"
+                attachment.name = f"{attachment.name} (gzip)"
+                attachment.type = "application/gzip"
+                return True
+        return False
+
+
+def install_background_file_logger(
+    reporter: Optional[Any] = None, gzip_min_size: int = 0
+) -> Optional[BackgroundAllureFileLogger]:
+    """Replace the AllureFileLogger registered by allure-pytest with a background one"""
+    file_logger = next(
+        (
+            plugin
+            for plugin in allure_commons.plugin_manager.get_plugins()
+            if type(plugin) is AllureFileLogger
+        ),
+        None,
+    )
+    if file_logger is None:
+        return None
+
+    report_dir = file_logger._report_dir
+    logger = BackgroundAllureFileLogger(
+        report_dir, AttachmentWriter(report_dir), reporter, gzip_min_size
+    )
+    logger.replaced = file_logger
+    allure_commons.plugin_manager.unregister(file_logger)
+    allure_commons.plugin_manager.register(logger)
+    return logger
+
+
+def uninstall_background_file_logger(logger: BackgroundAllureFileLogger) -> None:
+    """Write everything still queued and put the original logger back"""
+    logger.writer.close()
+    allure_commons.plugin_manager.unregister(logger)
+    # allure-pytest unregisters its own logger at cleanup, it must be registered
+    if logger.replaced is not None:
+        allure_commons.plugin_manager.register(logger.replaced)
@@ -1,5 +1,18 @@
 import allure
+import hashlib
+import os
+import random
 from random import randint
+from typing import List, Optional, Tuple
+
+
+# Post codes are five two-digit groups 00-25, each mapping to one letter of
+# the name, so distinct post codes always give distinct names. The first
+# group is 01-25 to keep every name five letters long.
+NAME_SPACE_SIZE = 25 * 26**4
+RUN_SHARDS = 64
+WORKER_SHARDS = 32
+DEFAULT_CUSTOMER_BATCH_SIZE = 20
 
 class DataGenerator:
     @staticmethod
@@ -22,4 +35,77 @@ class DataGenerator:
             
         name = mirror_random_name[::-1]
         allure.attach(name, name="Generated Name", attachment_type=allure.attachment_type.TEXT)
-        return name
\ No newline at end of file
+        return name
+
+
+class UniqueCustomerGenerator:
+    """Pre-generated (first name, post code) pairs unique across workers and runs.
+
+    The name space is split into RUN_SHARDS x WORKER_SHARDS ranges. A run
+    takes the range row of its run ID (a number is used as is, other IDs
+    are hashed) and every xdist worker its own range in that row, so
+    concurrent workers never collide and runs with distinct numeric IDs
+    below RUN_SHARDS never collide either.
+    """
+
+    def __init__(
+        self,
+        run_id: str,
+        worker_id: Optional[str] = None,
+        batch_size: int = DEFAULT_CUSTOMER_BATCH_SIZE,
+    ):
+        worker_id = worker_id or os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+        worker_index = int(worker_id[2:]) if worker_id[2:].isdigit() else 0
+        if run_id.isdigit():
+            run_index = int(run_id) % RUN_SHARDS
+        else:
+            run_index = int(hashlib.sha1(run_id.encode()).hexdigest(), 16) % RUN_SHARDS
+
+        shard_size = NAME_SPACE_SIZE // (RUN_SHARDS * WORKER_SHARDS)
+        shard = run_index * WORKER_SHARDS + worker_index % WORKER_SHARDS
+        self._start = shard * shard_size
+        self._size = shard_size
+        # Start inside the shard derived from the run and worker IDs, so a rerun
+        # with the same run ID reuses the same names; uniqueness comes from the
+        # shard split alone
+        self._next = random.Random(f"{run_id}:{worker_id}").randrange(shard_size)
+        self._issued = 0
+        self.batch_size = batch_size
+        self._batch: List[Tuple[str, str]] = []
+
+    @staticmethod
+    def _customer(value: int) -> Tuple[str, str]:
+        groups = []
+        for _ in range(4):
+            value, group = divmod(value, 26)
+            groups.append(group)
+        groups.append(value + 1)
+        groups.reverse()
+        post_code = "".join(f"{group:02d}" for group in groups)
+        first_name = "".join(chr(group + 97) for group in groups)
+        return first_name, post_code
+
+    def generate_batch(self, count: int) -> List[Tuple[str, str]]:
+        """Return the next `count` (first name, post code) pairs of this worker"""
+        if self._issued + count > self._size:
+            raise ValueError(
+                f"Customer name shard exhausted after {self._issued} customers"
+            )
+        customers = [
+            self._customer(self._start + (self._next + i) % self._size)
+            for i in range(count)
+        ]
+        self._next = (self._next + count) % self._size
+        self._issued += count
+        allure.attach(
+            "\n".join(f"{name} {post_code}" for name, post_code in customers),
+            name="Generated Customers",
+            attachment_type=allure.attachment_type.TEXT,
+        )
+        return customers
+
+    def next(self) -> Tuple[str, str]:
+        if not self._batch:
+            self._batch = self.generate_batch(self.batch_size)
+            self._batch.reverse()
+        return self._batch.pop()
\ No newline at end of file
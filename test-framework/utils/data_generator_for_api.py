@@ -1,6 +1,30 @@
+import os
 import random
 import string
-from typing import Dict, Any
+from typing import Dict, List, Optional, Tuple, Union
+from utils.entity_fingerprint import entity_fingerprint
+
+
+TITLE_PREFIX = "Валидирующий заголовок "
+ASCII_ALPHABET = string.ascii_letters + string.digits + string.punctuation
+UNICODE_ALPHABET = (
+    ASCII_ALPHABET
+    + "абвгдеёжзийклмнопрстуфхцчшщъыьэюяАБВГДЕЁЖЗИЙКЛМНОПРСТУФХЦЧШЩЪЫЬЭЮЯ"
+    + "漢字仮名交じり文한국어ελληνικάעבריתالعربية"
+    + "😀🚀✅🔥💡🎉"
+)
+DEFAULT_PAYLOAD_POOL_SIZE = 50
+
+
+class EntityPayload(dict):
+    """Entity payload carrying its content fingerprint, computed once on creation.
+
+    Payloads are treated as immutable; the fingerprint is not updated on changes.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fingerprint = entity_fingerprint(self)
 
 
 def generate_random_string(length: int = 10) -> str:
@@ -16,8 +40,7 @@ def generate_random_string(length: int = 10) -> str:
         random.choice(special_chars),
     ]
 
-    for _ in range(length - 3):
-        random_string.append(random.choice(all_chars))
+    random_string.extend(random.choices(all_chars, k=max(0, length - 3)))
 
     random.shuffle(random_string)
 
@@ -26,13 +49,139 @@ def generate_random_string(length: int = 10) -> str:
     return result
 
 
-def generate_entity_data() -> Dict[str, Any]:
-    return {
-        "addition": {
-            "additional_info": "Дополнительные сведения",
-            "additional_number": 123,
-        },
-        "important_numbers": [42, 87, 15],
-        "title": f"Валидирующий заголовок {generate_random_string()}",
-        "verified": True,
-    }
+def generate_entity_data() -> EntityPayload:
+    return EntityPayload(
+        {
+            "addition": {
+                "additional_info": "Дополнительные сведения",
+                "additional_number": 123,
+            },
+            "important_numbers": [42, 87, 15],
+            "title": f"Валидирующий заголовок {generate_random_string()}",
+            "verified": True,
+        }
+    )
+
+
+class PayloadProfile:
+    """Size distribution of generated payloads, all ranges inclusive"""
+
+    def __init__(
+        self,
+        title_length: Tuple[int, int] = (10, 10),
+        info_length: Tuple[int, int] = (10, 40),
+        numbers_count: Tuple[int, int] = (1, 10),
+        number_range: Tuple[int, int] = (0, 1000),
+        alphabet: str = ASCII_ALPHABET,
+    ):
+        self.title_length = title_length
+        self.info_length = info_length
+        self.numbers_count = numbers_count
+        self.number_range = number_range
+        self.alphabet = alphabet
+
+
+PAYLOAD_PROFILES: Dict[str, PayloadProfile] = {
+    "default": PayloadProfile(),
+    # Production-sized payloads: long texts and large important_numbers arrays
+    "large": PayloadProfile(
+        title_length=(200, 2000),
+        info_length=(500, 5000),
+        numbers_count=(100, 2000),
+        number_range=(-(2**31), 2**31 - 1),
+    ),
+    "unicode": PayloadProfile(
+        title_length=(10, 200),
+        info_length=(10, 500),
+        numbers_count=(1, 50),
+        alphabet=UNICODE_ALPHABET,
+    ),
+}
+
+
+def generate_entity_batch(
+    count: int,
+    seed: Union[int, str, random.Random, None] = None,
+    profile: str = "default",
+) -> List[EntityPayload]:
+    """Generate `count` payloads from a seed, drawing each kind of value in one call.
+
+    Lengths, characters and numbers of the whole batch are drawn with one
+    random.choices call each and then sliced per payload, so the same seed
+    and profile always give the same batch.
+    """
+    if profile not in PAYLOAD_PROFILES:
+        raise ValueError(
+            f"Unsupported payload profile: {profile}, "
+            f"expected one of {tuple(PAYLOAD_PROFILES)}"
+        )
+    spec = PAYLOAD_PROFILES[profile]
+    rng = seed if isinstance(seed, random.Random) else random.Random(seed)
+
+    def lengths(bounds: Tuple[int, int]) -> List[int]:
+        return rng.choices(range(bounds[0], bounds[1] + 1), k=count)
+
+    title_lengths = lengths(spec.title_length)
+    info_lengths = lengths(spec.info_length)
+    numbers_counts = lengths(spec.numbers_count)
+    chars = "".join(
+        rng.choices(spec.alphabet, k=sum(title_lengths) + sum(info_lengths))
+    )
+    low, high = spec.number_range
+    numbers = rng.choices(range(low, high + 1), k=sum(numbers_counts) + count)
+    flags = rng.choices((True, False), k=count)
+
+    payloads = []
+    char_pos = 0
+    number_pos = count  # the first `count` numbers are additional_number values
+    for i in range(count):
+        title = chars[char_pos : char_pos + title_lengths[i]]
+        char_pos += title_lengths[i]
+        info = chars[char_pos : char_pos + info_lengths[i]]
+        char_pos += info_lengths[i]
+        important_numbers = numbers[number_pos : number_pos + numbers_counts[i]]
+        number_pos += numbers_counts[i]
+        payloads.append(
+            EntityPayload(
+                {
+                    "addition": {
+                        "additional_info": info,
+                        "additional_number": numbers[i],
+                    },
+                    "important_numbers": important_numbers,
+                    "title": f"{TITLE_PREFIX}{title}",
+                    "verified": flags[i],
+                }
+            )
+        )
+    return payloads
+
+
+class PayloadPool:
+    """Pre-generated payloads handed out one at a time, refilled a batch at a time.
+
+    Each xdist worker derives its own stream from the seed, so workers do
+    not create identical entities and every worker's data is reproducible.
+    """
+
+    def __init__(
+        self,
+        seed: Union[int, str, None] = None,
+        profile: str = "default",
+        batch_size: int = DEFAULT_PAYLOAD_POOL_SIZE,
+        worker_id: Optional[str] = None,
+    ):
+        worker_id = worker_id or os.environ.get("PYTEST_XDIST_WORKER", "master")
+        self.seed = seed
+        self.profile = profile
+        self.batch_size = max(1, batch_size)
+        self._rng = random.Random(f"{seed}:{worker_id}" if seed is not None else None)
+        self._payloads: List[EntityPayload] = []
+
+    def next(self) -> EntityPayload:
+        if not self._payloads:
+            self._payloads = generate_entity_batch(
+                self.batch_size, self._rng, self.profile
+            )
+            self._payloads.reverse()
+        return self._payloads.pop()
@@ -0,0 +1,75 @@
+import json
+import os
+from typing import Dict, Optional
+from filelock import FileLock
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.firefox import GeckoDriverManager
+from webdriver_manager.core.driver_cache import DriverCacheManager
+
+
+DEFAULT_DRIVER_CACHE_DIR = os.path.join(
+    os.path.expanduser("~"), ".cache", "test-framework", "drivers"
+)
+DRIVER_MANAGERS = {"chrome": ChromeDriverManager, "firefox": GeckoDriverManager}
+
+# Paths resolved by this process, so a worker resolves each browser once
+_resolved: Dict[str, str] = {}
+
+
+def _manifest_path(cache_dir: str) -> str:
+    return os.path.join(cache_dir, "drivers.json")
+
+
+def _read_manifest(cache_dir: str) -> Dict[str, str]:
+    try:
+        with open(_manifest_path(cache_dir), encoding="utf-8") as file:
+            return json.load(file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _write_manifest(cache_dir: str, manifest: Dict[str, str]) -> None:
+    path = _manifest_path(cache_dir)
+    with open(f"{path}.tmp", "w", encoding="utf-8") as file:
+        json.dump(manifest, file, indent=2, sort_keys=True)
+    os.replace(f"{path}.tmp", path)
+
+
+def resolve_driver_binary(
+    browser: str, cache_dir: str = DEFAULT_DRIVER_CACHE_DIR, offline: bool = False
+) -> str:
+    """Return the driver binary path for the installed browser.
+
+    Paths are kept in a manifest keyed by browser and browser version and
+    guarded by a file lock, so parallel workers download a driver at most
+    once. In offline mode only the manifest is used and a missing entry
+    raises FileNotFoundError instead of reaching the network.
+    """
+    if browser in _resolved:
+        return _resolved[browser]
+    if browser not in DRIVER_MANAGERS:
+        raise ValueError(f"Unsupported browser: {browser}")
+
+    os.makedirs(cache_dir, exist_ok=True)
+    manager = DRIVER_MANAGERS[browser](
+        cache_manager=DriverCacheManager(root_dir=cache_dir)
+    )
+    # Read from the local browser binary, no network involved
+    browser_version: Optional[str] = manager.driver.get_browser_version_from_os()
+    key = f"{browser}-{browser_version or 'unknown'}"
+
+    with FileLock(os.path.join(cache_dir, "drivers.lock")):
+        manifest = _read_manifest(cache_dir)
+        path = manifest.get(key)
+        if not path or not os.path.isfile(path):
+            if offline:
+                raise FileNotFoundError(
+                    f"No cached driver for {key} in {cache_dir}; "
+                    "run once without offline mode to populate the cache"
+                )
+            path = manager.install()
+            manifest[key] = path
+            _write_manifest(cache_dir, manifest)
+
+    _resolved[browser] = path
+    return path
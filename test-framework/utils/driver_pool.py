@@ -0,0 +1,80 @@
+from typing import Callable, Dict, Optional, Tuple
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+DEFAULT_DRIVER_RECYCLE_AFTER = 20
+
+# Storage is per origin, so it is cleared while still on the page the test left
+CLEAR_STORAGE_SCRIPT = """
+try { window.localStorage.clear(); } catch (e) {}
+try { window.sessionStorage.clear(); } catch (e) {}
+"""
+
+
+class PooledDriver:
+    """A browser session reused by consecutive tests of one worker."""
+
+    def __init__(self, driver: WebDriver, browser: str, description: str):
+        self.driver = driver
+        self.browser = browser
+        self.description = description
+        self.uses = 0
+
+
+class DriverPool:
+    """One WebDriver session per browser, reset between tests instead of relaunched.
+
+    `factory(browser)` starts a session and returns (driver, actual browser,
+    description). A session is quit and replaced after `recycle_after` tests,
+    after a failed test, or when the reset itself fails.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[str], Tuple[WebDriver, str, str]],
+        recycle_after: int = DEFAULT_DRIVER_RECYCLE_AFTER,
+    ):
+        self.factory = factory
+        self.recycle_after = max(1, recycle_after)
+        self._sessions: Dict[str, PooledDriver] = {}
+
+    def acquire(self, browser: str) -> PooledDriver:
+        session = self._sessions.get(browser)
+        if session is None:
+            driver, actual_browser, description = self.factory(browser)
+            session = PooledDriver(driver, actual_browser, description)
+            self._sessions[browser] = session
+
+        session.uses += 1
+        return session
+
+    def release(self, browser: str, failed: bool = False) -> None:
+        session = self._sessions.get(browser)
+        if session is None:
+            return
+        if failed or session.uses >= self.recycle_after or not self._reset(session):
+            self._quit(browser)
+
+    def _reset(self, session: PooledDriver) -> bool:
+        try:
+            session.driver.delete_all_cookies()
+            session.driver.execute_script(CLEAR_STORAGE_SCRIPT)
+            session.driver.get("about:blank")
+            return True
+        except WebDriverException:
+            # An open alert or a crashed tab: start the next test in a new session
+            return False
+
+    def _quit(self, browser: str) -> None:
+        session: Optional[PooledDriver] = self._sessions.pop(browser, None)
+        if session is None:
+            return
+        try:
+            session.driver.quit()
+        except WebDriverException:
+            pass
+
+    def close(self) -> None:
+        for browser in list(self._sessions):
+            self._quit(browser)
@@ -0,0 +1,157 @@
+import heapq
+import statistics
+import time
+from typing import Dict, List, Optional, Tuple
+import pytest
+from xdist.scheduler import LoadScheduling
+
+
+DEFAULT_TEST_DURATION = 1.0
+# Weight of the latest run in the stored moving average of a test duration
+DURATION_SMOOTHING = 0.5
+# Tests queued on a worker: the running one and the next, which xdist needs
+WORKER_QUEUE_DEPTH = 2
+
+
+def predicted_makespan(durations: List[float], workers: int) -> float:
+    """Wall time of list scheduling the durations, in order, over the workers"""
+    loads = [0.0] * max(1, workers)
+    for duration in durations:
+        heapq.heappush(loads, heapq.heappop(loads) + duration)
+    return max(loads)
+
+
+class LongestFirstScheduling(LoadScheduling):
+    """xdist scheduler sending the longest predicted tests first.
+
+    Tests are ordered by their recorded duration, longest first, and every
+    worker holds at most WORKER_QUEUE_DEPTH tests, so the next test always
+    goes to the first worker that frees up (LPT list scheduling). Tests
+    without history are predicted with the median known duration.
+    """
+
+    def __init__(self, config, log, plugin: "DurationSchedulingPlugin"):
+        super().__init__(config, log)
+        self.plugin = plugin
+
+    def schedule(self) -> None:
+        assert self.collection_is_completed
+
+        if self.collection is not None:
+            for node in self.nodes:
+                self.check_schedule(node)
+            return
+
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.collection = list(self.node2collection.values())[0]
+        predicted = [self.plugin.predict(nodeid) for nodeid in self.collection]
+        self.pending[:] = sorted(
+            range(len(self.collection)), key=lambda index: -predicted[index]
+        )
+        self.plugin.record_prediction(sorted(predicted, reverse=True), len(self.nodes))
+
+        for _ in range(WORKER_QUEUE_DEPTH):
+            for node in self.nodes:
+                self._send_tests(node, 1)
+        if not self.pending:
+            for node in self.nodes:
+                node.shutdown()
+
+    def check_schedule(self, node, duration: float = 0) -> None:
+        if node.shutting_down:
+            return
+        if self.pending:
+            missing = WORKER_QUEUE_DEPTH - len(self.node2pending[node])
+            if missing > 0:
+                self._send_tests(node, missing)
+        else:
+            node.shutdown()
+
+
+class DurationSchedulingPlugin:
+    """Records test durations in the pytest cache and schedules xdist runs by them.
+
+    Durations are kept per browser, since the same UI test takes different
+    time in Chrome and Firefox. Registered on the controller process only.
+    """
+
+    def __init__(self, config, enabled: bool = True):
+        self.config = config
+        self.enabled = enabled
+        browser = config.getoption("--browser")
+        self.cache_key = f"duration_scheduling/{browser}"
+        cache = getattr(config, "cache", None)
+        self.durations: Dict[str, float] = (
+            cache.get(self.cache_key, {}) if cache is not None else {}
+        )
+        self.default_duration = (
+            statistics.median(self.durations.values())
+            if self.durations
+            else DEFAULT_TEST_DURATION
+        )
+        self.actual: Dict[str, float] = {}
+        self.worker_busy: Dict[str, float] = {}
+        self.prediction: Optional[Tuple[float, int, int]] = None
+        self.started = time.monotonic()
+
+    def predict(self, nodeid: str) -> float:
+        return self.durations.get(nodeid, self.default_duration)
+
+    def record_prediction(self, durations: List[float], workers: int) -> None:
+        self.prediction = (
+            predicted_makespan(durations, workers),
+            workers,
+            len(durations),
+        )
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_xdist_make_scheduler(self, config, log):
+        if not self.enabled or config.getoption("dist") != "load":
+            return None
+        return LongestFirstScheduling(config, log, self)
+
+    def pytest_runtest_logreport(self, report) -> None:
+        nodeid = report.nodeid
+        self.actual[nodeid] = self.actual.get(nodeid, 0.0) + report.duration
+        # Set by xdist on reports forwarded from a worker
+        node = getattr(report, "node", None)
+        if node is not None:
+            worker = node.gateway.id
+            busy = self.worker_busy.get(worker, 0.0)
+            self.worker_busy[worker] = busy + report.duration
+
+    def pytest_sessionfinish(self, session) -> None:
+        cache = getattr(self.config, "cache", None)
+        if cache is None or not self.actual:
+            return
+        durations = dict(self.durations)
+        for nodeid, duration in self.actual.items():
+            previous = durations.get(nodeid)
+            if previous is not None:
+                duration = previous + (duration - previous) * DURATION_SMOOTHING
+            durations[nodeid] = round(duration, 3)
+        cache.set(self.cache_key, durations)
+
+    def pytest_terminal_summary(self, terminalreporter) -> None:
+        if self.prediction is None:
+            return
+        makespan, workers, tests = self.prediction
+        history = sum(1 for nodeid in self.actual if nodeid in self.durations)
+        busy = ", ".join(
+            f"{worker} {seconds:.1f}s"
+            for worker, seconds in sorted(self.worker_busy.items())
+        )
+        terminalreporter.write_sep("-", "duration-aware scheduling")
+        terminalreporter.write_line(
+            f"{tests} tests over {workers} workers, {history} with recorded durations"
+        )
+        terminalreporter.write_line(
+            f"predicted: {makespan:.1f}s, actual: "
+            f"{max(self.worker_busy.values(), default=0.0):.1f}s busiest worker, "
+            f"{time.monotonic() - self.started:.1f}s wall time"
+        )
+        if busy:
+            terminalreporter.write_line(f"worker busy time: {busy}")
@@ -0,0 +1,62 @@
+import hashlib
+import json
+from pydantic import BaseModel
+from typing import Any, Dict, Iterable, List, Union
+
+
+def _without_ids(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {k: _without_ids(v) for k, v in value.items() if k != "id"}
+    if isinstance(value, list):
+        return [_without_ids(item) for item in value]
+    return value
+
+
+def entity_fingerprint(entity: Union[Dict[str, Any], BaseModel]) -> str:
+    """Return a content hash of an entity payload or response, ignoring all IDs."""
+    if isinstance(entity, BaseModel):
+        entity = entity.model_dump()
+
+    canonical = json.dumps(
+        _without_ids(entity), sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    )
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()
+
+
+def fingerprint_of(entity: Union[Dict[str, Any], BaseModel, str]) -> str:
+    """Return the precomputed fingerprint of a payload, computing it if there is none."""
+    if isinstance(entity, str):
+        return entity
+    fingerprint = getattr(entity, "fingerprint", None)
+    return fingerprint if fingerprint is not None else entity_fingerprint(entity)
+
+
+class EntityIndex:
+    """Fingerprint -> IDs index over a list of entities for O(1) membership checks."""
+
+    def __init__(self, entities: Iterable[Union[Dict[str, Any], BaseModel]] = ()):
+        self._ids: Dict[str, List[int]] = {}
+        self._count = 0
+        for entity in entities:
+            self.add(entity)
+
+    def add(self, entity: Union[Dict[str, Any], BaseModel]) -> None:
+        entity_id = entity.id if isinstance(entity, BaseModel) else entity["id"]
+        self._ids.setdefault(entity_fingerprint(entity), []).append(entity_id)
+        self._count += 1
+
+    def ids_for(self, entity: Union[Dict[str, Any], BaseModel, str]) -> List[int]:
+        """Return the IDs of listed entities with the same content as the payload."""
+        return self._ids.get(fingerprint_of(entity), [])
+
+    def missing(
+        self, entities: Iterable[Union[Dict[str, Any], BaseModel, str]]
+    ) -> List[Union[Dict[str, Any], BaseModel, str]]:
+        """Return the payloads that have no entity with the same content."""
+        return [entity for entity in entities if fingerprint_of(entity) not in self._ids]
+
+    def __contains__(self, entity: Union[Dict[str, Any], BaseModel, str]) -> bool:
+        return fingerprint_of(entity) in self._ids
+
+    def __len__(self) -> int:
+        return self._count
@@ -0,0 +1,78 @@
+import codecs
+import json
+import re
+from typing import Any, Iterable, Iterator
+
+
+_WHITESPACE = re.compile(r"[\s,]*")
+# Characters that can continue a number the decoder stopped before, e.g. 4500.
+_NUMBER_CONTINUATION = ".eE+-0123456789"
+
+
+def iter_array_items(chunks: Iterable[bytes], key: str) -> Iterator[Any]:
+    """Yield the items of the array under `key` in a streamed JSON object.
+
+    Items are decoded as soon as their closing bracket arrives, so a consumer
+    that stops iterating early never reads the rest of the body.
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    array_start = re.compile(r'"%s"\s*:\s*\[' % re.escape(key))
+    chunks = iter(chunks)
+    buffer = ""
+    exhausted = False
+
+    def read_more() -> bool:
+        nonlocal buffer, exhausted
+        for chunk in chunks:
+            if chunk:
+                buffer += utf8.decode(chunk)
+                return True
+        buffer += utf8.decode(b"", final=True)
+        exhausted = True
+        return False
+
+    # Find the opening bracket of the array
+    while True:
+        match = array_start.search(buffer)
+        if match:
+            pos = match.end()
+            break
+        if exhausted:
+            raise ValueError(f"Key '{key}' with an array value not found in stream")
+        read_more()
+
+    while True:
+        pos = _WHITESPACE.match(buffer, pos).end()
+        if pos == len(buffer):
+            if exhausted:
+                raise ValueError(f"Stream ended inside the '{key}' array")
+            buffer, pos = buffer[pos:], 0
+            read_more()
+            continue
+        if buffer[pos] == "]":
+            return
+
+        try:
+            item, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            item, end = None, None
+
+        # The decoder stops a number early at a cut, e.g. at 4500 of 4500.0
+        if (
+            end is not None
+            and end < len(buffer)
+            and buffer[end] in _NUMBER_CONTINUATION
+        ):
+            item, end = None, None
+
+        # A scalar at the end of the buffer may still be cut, e.g. 12 of 123
+        if end is None or (end == len(buffer) and not exhausted):
+            if exhausted:
+                raise ValueError(f"Invalid JSON item in the '{key}' array")
+            buffer, pos = buffer[pos:], 0
+            read_more()
+            continue
+
+        yield item
+        pos = end
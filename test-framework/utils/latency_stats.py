@@ -0,0 +1,122 @@
+import math
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+
+def percentile(sorted_samples: List[float], q: float) -> float:
+    """Return the q-th percentile (0-100) of sorted samples with linear interpolation."""
+    if not sorted_samples:
+        return 0.0
+    rank = (len(sorted_samples) - 1) * q / 100
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    fraction = rank - lower
+    return (
+        sorted_samples[lower]
+        + (sorted_samples[upper] - sorted_samples[lower]) * fraction
+    )
+
+
+class LatencyStats:
+    """Latency samples of one endpoint, in milliseconds."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.samples: List[float] = []
+        self.elapsed = 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        samples = sorted(self.samples)
+        return {
+            "requests": len(samples),
+            "p50_ms": round(percentile(samples, 50), 3),
+            "p95_ms": round(percentile(samples, 95), 3),
+            "p99_ms": round(percentile(samples, 99), 3),
+            "max_ms": round(samples[-1], 3) if samples else 0.0,
+            "mean_ms": round(sum(samples) / len(samples), 3) if samples else 0.0,
+            "throughput_rps": (
+                round(len(samples) / self.elapsed, 2) if self.elapsed else 0.0
+            ),
+        }
+
+
+def measure(
+    name: str,
+    operation: Callable[[int], Any],
+    iterations: int,
+    warmup: int = 0,
+) -> LatencyStats:
+    """Run operation(i) warmup + iterations times and record the timed iterations.
+
+    Warmup calls get indices 0..warmup-1, timed calls the following ones,
+    so operations that consume prepared data can index it directly.
+    """
+    for i in range(warmup):
+        operation(i)
+
+    stats = LatencyStats(name)
+    started = time.perf_counter()
+    for i in range(warmup, warmup + iterations):
+        call_started = time.perf_counter()
+        operation(i)
+        stats.samples.append((time.perf_counter() - call_started) * 1000)
+    stats.elapsed = time.perf_counter() - started
+    return stats
+
+
+def find_regressions(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    max_regression: float,
+    metric: str = "p95_ms",
+) -> List[str]:
+    """Compare endpoint summaries with a baseline and describe the regressions."""
+    regressions = []
+    for endpoint, summary in current.items():
+        previous: Optional[Dict[str, Any]] = baseline.get(endpoint)
+        if not previous or not previous.get(metric):
+            continue
+        ratio = summary[metric] / previous[metric]
+        if ratio > 1 + max_regression:
+            regressions.append(
+                f"{endpoint}: {metric} {previous[metric]} -> {summary[metric]} "
+                f"(+{(ratio - 1) * 100:.0f}%, allowed +{max_regression * 100:.0f}%)"
+            )
+    return regressions
+
+
+def render_histogram_svg(stats: LatencyStats, bins: int = 30) -> str:
+    """Render the latency distribution as an SVG bar chart."""
+    width, height, margin = 640, 240, 40
+    samples = stats.samples or [0.0]
+    low, high = min(samples), max(samples)
+    span = (high - low) or 1.0
+    counts = [0] * bins
+    for sample in samples:
+        counts[min(int((sample - low) / span * bins), bins - 1)] += 1
+
+    peak = max(counts) or 1
+    bar_width = (width - 2 * margin) / bins
+    bars = []
+    for i, count in enumerate(counts):
+        bar_height = (height - 2 * margin) * count / peak
+        bars.append(
+            f'<rect x="{margin + i * bar_width:.1f}" '
+            f'y="{height - margin - bar_height:.1f}" '
+            f'width="{bar_width - 1:.1f}" height="{bar_height:.1f}" fill="#4a90d9">'
+            f"<title>{low + i * span / bins:.2f}-{low + (i + 1) * span / bins:.2f} ms: "
+            f"{count}</title></rect>"
+        )
+
+    summary = stats.summary()
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'font-family="sans-serif" font-size="12">'
+        f'<text x="{margin}" y="20">{stats.name}: p50 {summary["p50_ms"]} ms, '
+        f'p95 {summary["p95_ms"]} ms, p99 {summary["p99_ms"]} ms, '
+        f'max {summary["max_ms"]} ms</text>'
+        f'{"".join(bars)}'
+        f'<text x="{margin}" y="{height - 15}">{low:.2f} ms</text>'
+        f'<text x="{width - margin}" y="{height - 15}" text-anchor="end">'
+        f"{high:.2f} ms</text></svg>"
+    )
@@ -0,0 +1,278 @@
+import base64
+import json
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+from selenium.common.exceptions import WebDriverException
+
+
+# Ads, analytics and web fonts loaded by the globalsqa pages, unused by the app
+DEFAULT_BLOCKLIST = (
+    "doubleclick.net",
+    "googlesyndication.com",
+    "googleadservices.com",
+    "googletagservices.com",
+    "googletagmanager.com",
+    "google-analytics.com",
+    "adservice.google.com",
+    "amazon-adsystem.com",
+    "facebook.net",
+    "hotjar.com",
+    "fonts.googleapis.com",
+    "fonts.gstatic.com",
+)
+# Nothing listens on the discard port, so proxied requests fail at once
+BLOCKING_PROXY = "PROXY 127.0.0.1:9"
+# Size estimates by resource type for blocked hosts never seen unblocked
+DEFAULT_RESOURCE_SIZES = {
+    "script": 60000,
+    "link": 20000,
+    "img": 15000,
+    "iframe": 100000,
+    "font": 30000,
+    "xhr": 2000,
+    "fetch": 2000,
+    "ping": 0,
+}
+# Chrome network log resource types, as the resource types above
+CHROME_RESOURCE_TYPES = {
+    "Script": "script",
+    "Stylesheet": "link",
+    "Image": "img",
+    "Document": "iframe",
+    "Font": "font",
+    "XHR": "xhr",
+    "Fetch": "fetch",
+    "Ping": "ping",
+}
+
+PAC_TEMPLATE = """var BLOCKED = %s;
+var ALLOWED = %s;
+function matches(host, domains) {
+    for (var i = 0; i < domains.length; i++) {
+        var domain = domains[i];
+        if (domain === "*" || host === domain
+                || host.slice(-domain.length - 1) === "." + domain) {
+            return true;
+        }
+    }
+    return false;
+}
+function FindProxyForURL(url, host) {
+    host = host.toLowerCase();
+    if (matches(host, ALLOWED) || !matches(host, BLOCKED)) return "DIRECT";
+    return "%s";
+}
+"""
+
+# Resources the page loaded (with body sizes, 0 for opaque cross-origin ones)
+# and the resource URLs its DOM references, by element type
+COLLECT_RESOURCES_SCRIPT = """
+const loaded = {};
+for (const entry of performance.getEntriesByType('resource')) {
+    loaded[entry.name] = entry.encodedBodySize || entry.transferSize || 0;
+}
+const referenced = [];
+const elements = document.querySelectorAll(
+    'script[src], link[href][rel~="stylesheet"], link[href][rel="preload"], '
+    + 'img[src], iframe[src]'
+);
+for (const element of elements) {
+    referenced.push([element.tagName.toLowerCase(), element.src || element.href]);
+}
+return {loaded: loaded, referenced: referenced};
+"""
+
+
+def _matches(host: str, domains: Sequence[str]) -> bool:
+    return any(
+        domain == "*" or host == domain or host.endswith(f".{domain}")
+        for domain in domains
+    )
+
+
+class ResourceBlocking:
+    """Blocks third-party hosts in the browser and reports what it saved.
+
+    Hosts matching the blocklist and not the allowlist are routed through a
+    PAC script to a proxy that refuses connections, which works the same
+    for local and Grid sessions of Chrome and Firefox. A list entry matches
+    the domain and its subdomains, "*" matches every host, so an allowlist
+    with a "*" blocklist lets through only the allowed hosts.
+
+    In Chrome every failed request to a blocked host is counted from the
+    network performance log, XHR, fetch and beacons included. Firefox has
+    no such log, there the static script, stylesheet, image and iframe
+    tags referencing blocked hosts are counted, so requests made from
+    script are missing. Bytes saved are estimated from sizes learned per
+    host on runs with blocking off, or DEFAULT_RESOURCE_SIZES by type.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.blocklist: Tuple[str, ...] = DEFAULT_BLOCKLIST
+        self.allowlist: Tuple[str, ...] = ()
+        # [average size, samples] per blocked host, from earlier runs
+        self.sizes: Dict[str, List[float]] = {}
+        # [total size, samples] per blocked host, learned in this process
+        self.learned: Dict[str, List[float]] = {}
+        self._blocked: List[Tuple[str, str]] = []
+        self._network_log = False
+        # URL and resource type by network log request id
+        self._requests: Dict[str, Tuple[str, str]] = {}
+
+    def configure(
+        self,
+        enabled: bool = True,
+        blocklist: Sequence[str] = DEFAULT_BLOCKLIST,
+        allowlist: Sequence[str] = (),
+        sizes: Optional[Dict[str, List[float]]] = None,
+    ) -> None:
+        self.enabled = enabled
+        self.blocklist = tuple(domain.strip().lower() for domain in blocklist if domain)
+        self.allowlist = tuple(domain.strip().lower() for domain in allowlist if domain)
+        self.sizes = dict(sizes or {})
+
+    def is_blocked(self, host: str) -> bool:
+        host = host.lower()
+        return _matches(host, self.blocklist) and not _matches(host, self.allowlist)
+
+    def pac_script(self) -> str:
+        return PAC_TEMPLATE % (
+            json.dumps(list(self.blocklist)),
+            json.dumps(list(self.allowlist)),
+            BLOCKING_PROXY,
+        )
+
+    def pac_url(self) -> str:
+        encoded = base64.b64encode(self.pac_script().encode("utf-8")).decode("ascii")
+        return f"data:application/x-ns-proxy-autoconfig;base64,{encoded}"
+
+    def apply_to_chrome(self, options: Any) -> None:
+        if self.enabled:
+            options.add_argument(f"--proxy-pac-url={self.pac_url()}")
+            # Network events only, read back with get_log("performance")
+            options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+            options.add_experimental_option(
+                "perfLoggingPrefs", {"enableNetwork": True, "enablePage": False}
+            )
+
+    def apply_to_firefox(self, options: Any) -> None:
+        if self.enabled:
+            # 2 - proxy auto-configuration from network.proxy.autoconfig_url
+            options.set_preference("network.proxy.type", 2)
+            options.set_preference("network.proxy.autoconfig_url", self.pac_url())
+
+    def start_test(self, driver: Any) -> None:
+        self._blocked = []
+        self._network_log = False
+        self._requests = {}
+        capabilities = getattr(driver, "capabilities", None) or {}
+        if self.enabled and capabilities.get("browserName") == "chrome":
+            try:
+                # Drop the entries of the previous test on a pooled session
+                driver.get_log("performance")
+                self._network_log = True
+            except WebDriverException:
+                pass
+
+    def record_page(self, driver: Any) -> None:
+        """Count the blocked requests of the current page, before leaving it"""
+        if self._network_log:
+            self._record_network_log(driver)
+            # Sizes are learned only with blocking off, from the page below
+            return
+        try:
+            resources = driver.execute_script(COLLECT_RESOURCES_SCRIPT)
+        except WebDriverException:
+            # E.g. an open alert, the page is left uncounted
+            return
+        if not resources:
+            return
+        for tag, url in resources["referenced"]:
+            host = urlsplit(url).hostname or ""
+            if host and self.is_blocked(host):
+                if self.enabled:
+                    self._blocked.append((host, tag))
+                else:
+                    self._learn(host, resources["loaded"].get(url, 0))
+
+    def _record_network_log(self, driver: Any) -> None:
+        try:
+            entries = driver.get_log("performance")
+        except WebDriverException:
+            return
+        for entry in entries:
+            message = json.loads(entry["message"])["message"]
+            params = message.get("params", {})
+            if message.get("method") == "Network.requestWillBeSent":
+                self._requests[params["requestId"]] = (
+                    params["request"]["url"],
+                    params.get("type", ""),
+                )
+            elif message.get("method") == "Network.loadingFailed":
+                url, resource_type = self._requests.pop(
+                    params.get("requestId"), ("", "")
+                )
+                host = urlsplit(url).hostname or ""
+                if host and self.is_blocked(host):
+                    resource_type = params.get("type") or resource_type
+                    self._blocked.append(
+                        (host, CHROME_RESOURCE_TYPES.get(resource_type, "other"))
+                    )
+
+    def _learn(self, host: str, size: float) -> None:
+        if size > 0:
+            total, samples = self.learned.get(host, (0.0, 0))
+            self.learned[host] = [total + size, samples + 1]
+
+    def merge_learned(self, learned: Dict[str, List[float]]) -> None:
+        """Add sizes learned by another process, e.g. an xdist worker"""
+        for host, (size, samples) in learned.items():
+            total, count = self.learned.get(host, (0.0, 0))
+            self.learned[host] = [total + size, count + samples]
+
+    def updated_sizes(self) -> Dict[str, List[float]]:
+        """Sizes of earlier runs combined with the ones learned in this run"""
+        sizes = dict(self.sizes)
+        for host, (total, samples) in self.learned.items():
+            average, count = sizes.get(host, (0.0, 0))
+            sizes[host] = [
+                (average * count + total) / (count + samples),
+                count + samples,
+            ]
+        return sizes
+
+    def estimated_size(self, host: str, resource_type: str) -> float:
+        if host in self.sizes:
+            return self.sizes[host][0]
+        return DEFAULT_RESOURCE_SIZES.get(resource_type, 0)
+
+    def has_blocked(self) -> bool:
+        return bool(self._blocked)
+
+    def report(self) -> str:
+        """Blocked requests of the running test by host, most saved bytes first"""
+        hosts: Dict[str, List[float]] = {}
+        for host, resource_type in self._blocked:
+            count, saved = hosts.get(host, (0, 0.0))
+            hosts[host] = [count + 1, saved + self.estimated_size(host, resource_type)]
+        total = sum(saved for _, saved in hosts.values())
+        source = (
+            "Chrome network log, every failed request to a blocked host"
+            if self._network_log
+            else "static script, stylesheet, image and iframe tags of the pages; "
+            "requests made from script are not counted"
+        )
+        lines = [
+            f"Blocked requests: {len(self._blocked)}",
+            f"Bytes saved (estimated): {total / 1024:.1f} KiB",
+            f"Counted from: {source}",
+            "",
+            f"{'requests':>8} {'KiB':>9}  host",
+        ]
+        for host, (count, saved) in sorted(hosts.items(), key=lambda item: -item[1][1]):
+            lines.append(f"{count:>8} {saved / 1024:>9.1f}  {host}")
+        return "\n".join(lines)
+
+
+resource_blocking = ResourceBlocking()
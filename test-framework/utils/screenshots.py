@@ -0,0 +1,157 @@
+import hashlib
+import io
+import warnings
+from typing import Any, Optional
+from uuid import uuid4
+import allure
+import allure_commons
+from selenium.common.exceptions import WebDriverException
+from utils.attachment_writer import AttachmentWriter
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional, needed only to downscale or re-encode
+    Image = None
+
+
+SCREENSHOT_POLICIES = ("always", "on-step-failure", "on-failure")
+SCREENSHOT_FORMATS = ("png", "jpeg")
+
+
+class ScreenshotPipeline:
+    """Screenshots captured on the test thread, encoded and written in the background.
+
+    Policies: always - page object screenshots, failed steps and failed
+    tests; on-step-failure - failed steps and failed tests; on-failure -
+    failed tests only. A frame identical to the previous one of the test is
+    not attached again, unless it is forced (failure screenshots are).
+    """
+
+    def __init__(self):
+        self.policy = "always"
+        self.scale = 1.0
+        self.image_format = "png"
+        self.quality = 75
+        # Driver of the running UI test, used for failed step screenshots
+        self.driver: Optional[Any] = None
+        self._reporter: Optional[Any] = None
+        self._writer: Optional[AttachmentWriter] = None
+        self._last_hash: Optional[str] = None
+        self._last_failure: Optional[BaseException] = None
+
+    def configure(
+        self,
+        policy: str = "always",
+        scale: float = 1.0,
+        image_format: str = "png",
+        quality: int = 75,
+        reporter: Optional[Any] = None,
+        writer: Optional[AttachmentWriter] = None,
+    ) -> None:
+        """Set the policy and encoding; without a writer attach synchronously"""
+        if policy not in SCREENSHOT_POLICIES:
+            raise ValueError(
+                f"Unsupported screenshot policy: {policy}, "
+                f"expected one of {SCREENSHOT_POLICIES}"
+            )
+        if image_format not in SCREENSHOT_FORMATS:
+            raise ValueError(
+                f"Unsupported screenshot format: {image_format}, "
+                f"expected one of {SCREENSHOT_FORMATS}"
+            )
+        if Image is None and (scale < 1 or image_format != "png"):
+            warnings.warn(
+                "Pillow is not installed, screenshots are kept as full-size PNG"
+            )
+            scale, image_format = 1.0, "png"
+
+        self.policy = policy
+        self.scale = scale
+        self.image_format = image_format
+        self.quality = quality
+        self._reporter = reporter
+        self._writer = writer if reporter is not None else None
+
+    def start_test(self, driver: Any) -> None:
+        self.driver = driver
+        self._last_hash = None
+        self._last_failure = None
+
+    def end_test(self) -> None:
+        self.driver = None
+
+    def take(self, driver: Any, name: str = "screenshot") -> None:
+        """Page object screenshot, taken only with the always policy"""
+        if self.policy == "always":
+            with allure.step("Take screenshot"):
+                self.capture(driver, name)
+
+    def on_step_failure(self, exc_val: BaseException) -> None:
+        # Enclosing steps fail with the same exception, capture only the innermost
+        if (
+            self.policy == "on-failure"
+            or self.driver is None
+            or exc_val is self._last_failure
+        ):
+            return
+        self._last_failure = exc_val
+        try:
+            self.capture(self.driver, "step_failure_screenshot")
+        except WebDriverException:
+            pass
+
+    def capture(self, driver: Any, name: str, force: bool = False) -> None:
+        png = driver.get_screenshot_as_png()
+        digest = hashlib.sha1(png).hexdigest()
+        if digest == self._last_hash and not force:
+            return
+        self._last_hash = digest
+
+        attachment_type = (
+            allure.attachment_type.JPG
+            if self.image_format == "jpeg"
+            else allure.attachment_type.PNG
+        )
+        if self._writer is None:
+            allure.attach(self._encode(png), name=name, attachment_type=attachment_type)
+            return
+
+        # Link the attachment to the current step now, write the file later
+        file_name = self._reporter._attach(
+            uuid4(), name=name, attachment_type=attachment_type
+        )
+        self._writer.submit(file_name, lambda: self._encode(png))
+
+    def _encode(self, png: bytes) -> bytes:
+        if Image is None or (self.scale >= 1 and self.image_format == "png"):
+            return png
+        image = Image.open(io.BytesIO(png))
+        if self.scale < 1:
+            width, height = image.size
+            image = image.resize(
+                (max(1, int(width * self.scale)), max(1, int(height * self.scale))),
+                Image.LANCZOS,
+            )
+        output = io.BytesIO()
+        if self.image_format == "jpeg":
+            image.convert("RGB").save(
+                output, "JPEG", quality=self.quality, optimize=True
+            )
+        else:
+            image.save(output, "PNG", optimize=True)
+        return output.getvalue()
+
+
+class StepFailureScreenshots:
+    """Allure plugin taking a screenshot when a step fails, before it is closed"""
+
+    def __init__(self, pipeline: ScreenshotPipeline):
+        self.pipeline = pipeline
+
+    @allure_commons.hookimpl(tryfirst=True)
+    def stop_step(self, uuid, exc_type, exc_val, exc_tb) -> None:
+        if exc_val is not None:
+            self.pipeline.on_step_failure(exc_val)
+
+
+screenshots = ScreenshotPipeline()
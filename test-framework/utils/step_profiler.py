@@ -0,0 +1,235 @@
+import functools
+import json
+import os
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+import allure_commons
+import pytest
+
+
+PROFILE_FORMATS = ("chrome", "speedscope")
+TOP_SELF_TIME_STEPS = 20
+# Numbers left in step titles after parameters are replaced, e.g. ports
+_NUMBER = re.compile(r"\d+")
+
+# A finished span: [name, kind, start, duration, self time, test, worker,
+# aggregation key], times in seconds since the epoch
+Span = List[Any]
+
+
+def step_key(title: str, params: Dict[str, str]) -> str:
+    """Title of a step with its parameter values as placeholders.
+
+    Steps titled with f-strings have no parameters, numbers in their
+    titles are replaced instead, so "Get entity by ID 3" and "... ID 6"
+    are aggregated as one step.
+    """
+    key = title
+    for name, value in sorted(params.items(), key=lambda item: -len(item[1] or "")):
+        if value and value in key:
+            key = key.replace(value, f"{{{name}}}")
+    return _NUMBER.sub("#", key)
+
+
+class StepProfiler:
+    """Times tests, their phases, fixture setup/teardown and Allure steps.
+
+    Spans are recorded on the thread running the tests as a call tree: each
+    one is nested in the span open when it started, and its self time is its
+    duration minus that of its children. Steps started from other threads
+    are ignored.
+    """
+
+    def __init__(self, worker: str = "main"):
+        self.worker = worker
+        self.spans: List[Span] = []
+        # Open spans: [name, kind, key, start, children duration]
+        self._stack: List[List[Any]] = []
+        self._test = ""
+        self._thread = threading.get_ident()
+        self._epoch = time.time() - time.perf_counter()
+
+    def open(self, name: str, kind: str, key: Optional[str] = None) -> None:
+        if threading.get_ident() == self._thread:
+            self._stack.append(
+                [name, kind, key or name, self._epoch + time.perf_counter(), 0.0]
+            )
+
+    def close(self) -> None:
+        if threading.get_ident() != self._thread or not self._stack:
+            return
+        name, kind, key, start, children = self._stack.pop()
+        duration = self._epoch + time.perf_counter() - start
+        if self._stack:
+            self._stack[-1][4] += duration
+        self.spans.append(
+            [
+                name,
+                kind,
+                start,
+                duration,
+                duration - children,
+                self._test,
+                self.worker,
+                key,
+            ]
+        )
+
+    @allure_commons.hookimpl
+    def start_step(self, uuid, title, params) -> None:
+        self.open(title, "step", step_key(title, params or {}))
+
+    @allure_commons.hookimpl
+    def stop_step(self, uuid, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        self._test = item.nodeid
+        self.open(item.nodeid, "test")
+        yield
+        self.close()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_setup(self, item):
+        self.open("setup", "phase")
+        yield
+        self.close()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item):
+        self.open("call", "phase")
+        yield
+        self.close()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_teardown(self, item, nextitem):
+        self.open("teardown", "phase")
+        yield
+        self.close()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef, request):
+        self.open(f"{fixturedef.argname} (setup)", "fixture")
+        yield
+        self.close()
+        # Teardown runs the finalizers registered while setting the fixture up
+        finalizers = getattr(fixturedef, "_finalizers", [])
+        for index, finalizer in enumerate(finalizers):
+            finalizers[index] = self._timed(
+                finalizer, f"{fixturedef.argname} (teardown)", "fixture"
+            )
+
+    def _timed(self, function: Any, name: str, kind: str) -> Any:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            self.open(name, kind)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.close()
+
+        return wrapper
+
+
+def self_time_table(spans: List[Span], top: int = TOP_SELF_TIME_STEPS) -> str:
+    """Spans aggregated by kind and key, the largest self time first"""
+    totals: Dict[Tuple[str, str], List[float]] = {}
+    for _, kind, _, duration, self_time, _, _, key in spans:
+        calls, total, own = totals.get((kind, key), (0, 0.0, 0.0))
+        totals[(kind, key)] = [calls + 1, total + duration, own + self_time]
+    rows = sorted(totals.items(), key=lambda item: -item[1][2])[:top]
+    header = f"{'self s':>9} {'total s':>9} {'calls':>6}  {'kind':<8} name"
+    lines = [header]
+    for (kind, name), (calls, total, own) in rows:
+        lines.append(f"{own:>9.3f} {total:>9.3f} {calls:>6}  {kind:<8} {name}")
+    return "\n".join(lines)
+
+
+def chrome_trace(spans: List[Span]) -> Dict[str, Any]:
+    """Chrome trace event format, one process per xdist worker"""
+    workers = sorted({span[6] for span in spans})
+    pids = {worker: pid for pid, worker in enumerate(workers, start=1)}
+    events: List[Dict[str, Any]] = [
+        {"name": "process_name", "ph": "M", "pid": pid, "args": {"name": worker}}
+        for worker, pid in pids.items()
+    ]
+    for name, kind, start, duration, _, test, worker, _ in spans:
+        events.append(
+            {
+                "name": name,
+                "cat": kind,
+                "ph": "X",
+                "ts": round(start * 1e6, 1),
+                "dur": round(duration * 1e6, 1),
+                "pid": pids[worker],
+                "tid": 1,
+                "args": {"test": test},
+            }
+        )
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def speedscope_profile(spans: List[Span]) -> Dict[str, Any]:
+    """speedscope file with an evented profile per test"""
+    frames: List[Dict[str, str]] = []
+    frame_index: Dict[str, int] = {}
+    tests: Dict[Tuple[str, str], List[Span]] = {}
+    for span in spans:
+        tests.setdefault((span[6], span[5]), []).append(span)
+
+    profiles = []
+    for (worker, test), test_spans in tests.items():
+        # Parents first: earlier start, then longer duration
+        test_spans.sort(key=lambda span: (span[2], -span[3]))
+        events: List[Dict[str, Any]] = []
+        stack: List[Tuple[int, float]] = []
+        for name, _, start, duration, _, _, _, _ in test_spans:
+            while stack and stack[-1][1] <= start:
+                frame, end = stack.pop()
+                events.append({"type": "C", "frame": frame, "at": end * 1000})
+            if name not in frame_index:
+                frame_index[name] = len(frames)
+                frames.append({"name": name})
+            # A child cannot outlast its parent, even with rounding
+            end = min(start + duration, stack[-1][1]) if stack else start + duration
+            events.append({"type": "O", "frame": frame_index[name], "at": start * 1000})
+            stack.append((frame_index[name], end))
+        while stack:
+            frame, end = stack.pop()
+            events.append({"type": "C", "frame": frame, "at": end * 1000})
+        profiles.append(
+            {
+                "type": "evented",
+                "name": f"{test or 'session'} [{worker}]",
+                "unit": "milliseconds",
+                "startValue": events[0]["at"],
+                "endValue": events[-1]["at"],
+                "events": events,
+            }
+        )
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "shared": {"frames": frames},
+        "profiles": profiles,
+        "name": "Step profile",
+        "exporter": "test-framework",
+    }
+
+
+def write_profile(spans: List[Span], path: str, profile_format: str = "chrome") -> None:
+    if profile_format not in PROFILE_FORMATS:
+        raise ValueError(
+            f"Unsupported profile format: {profile_format}, "
+            f"expected one of {PROFILE_FORMATS}"
+        )
+    profile = (
+        chrome_trace(spans) if profile_format == "chrome" else speedscope_profile(spans)
+    )
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(profile, file)